@@ -6,394 +6,1045 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Union, Tuple
+import json
 import re
 
+from config import BEHAVIOR_TRAIT_LABELS
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# SoA 행동 특성 열 순서 (config의 라벨 정의와 동일)
+BEHAVIOR_TRAIT_KEYS = tuple(BEHAVIOR_TRAIT_LABELS)
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from joblib import Parallel, delayed, cpu_count
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 프로세스 풀 병렬화가 직렬화 비용을 상쇄하는 최소 행 수
+PARALLEL_MIN_SIZE = 20000
+
+if hasattr(np, 'bitwise_count'):
+    _bitwise_count = np.bitwise_count
+else:
+    def _bitwise_count(x: np.ndarray) -> np.ndarray:
+        """uint64 SWAR popcount 폴백 (np.bitwise_count는 NumPy 2.0부터 제공)"""
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + \
+            ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+if NUMBA_AVAILABLE:
+
+    def _score_all_impl(ages, weights_arr, behavior_mat, ideals, acc_bits,
+                        region_scores, personality_scores, params, flags, comp_weights):
+        """
+        전체 동물에 대한 매치 점수를 한 번에 계산하는 Numba 커널
+
+        params: [나이 선호 min/max, 나이 허용 min/max,
+                 크기 선호 min/max, 크기 허용 min/max] (float32)
+        flags: [지역, 나이, 크기, 성격, 행동] 선호 존재 여부
+        acc_bits: 행동 특성별 허용 점수(1-5)를 비트마스크로 인코딩
+        """
+        n = ages.shape[0]
+        k_traits = ideals.shape[0]
+        out = np.empty(n, dtype=np.float32)
+
+        for i in numba.prange(n):
+            total = 0.0
+            weight_sum = 0.0
+
+            # 지역 매치
+            if flags[0]:
+                total += region_scores[i] * comp_weights[0]
+                weight_sum += comp_weights[0]
+
+            # 나이 매치
+            if flags[1]:
+                age = ages[i]
+                if np.isnan(age):
+                    score = 0.5
+                elif params[0] <= age <= params[1]:
+                    score = 1.0
+                elif params[2] <= age <= params[3]:
+                    score = 0.7
+                else:
+                    score = 0.0
+                total += score * comp_weights[1]
+                weight_sum += comp_weights[1]
+
+            # 크기 매치
+            if flags[2]:
+                w = weights_arr[i]
+                if np.isnan(w):
+                    score = 0.5
+                elif params[4] <= w <= params[5]:
+                    score = 1.0
+                elif params[6] <= w <= params[7]:
+                    score = 0.7
+                else:
+                    score = 0.0
+                total += score * comp_weights[2]
+                weight_sum += comp_weights[2]
+
+            # 성격 매치
+            if flags[3]:
+                total += personality_scores[i] * comp_weights[3]
+                weight_sum += comp_weights[3]
+
+            # 행동 특성 매치
+            if flags[4]:
+                behavior_total = 0.0
+                valid_traits = 0
+                for k in range(k_traits):
+                    value = behavior_mat[i, k]
+                    if np.isnan(value):
+                        continue
+                    ideal = ideals[k]
+                    int_value = np.int64(value)
+                    if not np.isnan(ideal) and value == ideal:
+                        behavior_total += 1.0
+                    elif value == int_value and 0 <= int_value < 64 and \
+                            (acc_bits[k] >> np.uint64(int_value)) & np.uint64(1):
+                        behavior_total += 0.7
+                    else:
+                        distance = abs(value - ideal) if not np.isnan(ideal) else 0.0
+                        behavior_total += max(0.0, 1.0 - distance / 4.0)
+                    valid_traits += 1
+
+                score = behavior_total / valid_traits if valid_traits > 0 else 0.5
+                total += score * comp_weights[4]
+                weight_sum += comp_weights[4]
+
+            out[i] = total / weight_sum if weight_sum > 0 else 0.0
+
+        return out
+
+    # fastmath는 NaN 판정(결측 처리)을 무효화하므로 사용하지 않음
+    _score_all_kernel = numba.njit(cache=True, parallel=True)(_score_all_impl)
+
+
+# build_ext.py로 AOT 빌드된 확장 모듈이 있으면 JIT 컴파일 지연 없이 사용
+try:
+    from animal_score import score_all as _score_all_kernel  # noqa: F811
+    KERNEL_AVAILABLE = True
+except ImportError:
+    KERNEL_AVAILABLE = NUMBA_AVAILABLE
+
+# numexpr를 사용할 최소 데이터 크기 (작은 배열은 numpy가 더 빠름)
+NUMEXPR_MIN_SIZE = 10000
+
+
+def _range_mask(arr: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """NaN을 제외한 [lo, hi] 범위 불리언 마스크를 단일 패스로 생성"""
+    if NUMEXPR_AVAILABLE and arr.size >= NUMEXPR_MIN_SIZE:
+        # arr == arr 비교로 NaN 제거 (NaN != NaN 성질 이용)
+        return ne.evaluate('(arr >= lo) & (arr <= hi) & (arr == arr)')
+    return np.logical_and(np.logical_and(arr >= lo, arr <= hi), ~np.isnan(arr))
+
 
 class AnimalFilter:
     """임시보호 동물 필터링 클래스"""
-    
+
+    # 조건별 선택도 추정치(통과 비율, 낮을수록 먼저 적용)
+    # 많이 걸러내는 조건을 앞에 두어 뒤의 비싼 행 단위 술어가 좁은 집합만 보게 함
+    _FILTER_SELECTIVITY_HINT = {
+        'region': 0.2,
+        'care_type': 0.3,
+        'hashtags': 0.4,
+        'gender': 0.5,
+        'suitable_homes': 0.5,
+        'age_range': 0.6,
+        'weight_range': 0.6,
+        'behavior_traits': 0.7,
+        'neutered': 0.8,
+        'health_requirements': 0.8,
+        'care_preferences': 0.8,
+    }
+
+    # 선호 프로필별 점수 캐시 상한 (배치에서 중복 프로필이 재사용)
+    _SCORE_CACHE_MAX = 8
+
+
     def __init__(self, animals: Optional[pd.DataFrame] = None):
-        self.animals = animals if animals is not None else pd.DataFrame()
+        self.animals = self._downcast_columns(animals) if animals is not None \
+            else pd.DataFrame()
         self.filtered_results = pd.DataFrame()
-    
+        self._materialize_soa()
+
     def set_animals(self, animals: pd.DataFrame) -> 'AnimalFilter':
         """동물 데이터 설정"""
-        self.animals = animals
+        self.animals = self._downcast_columns(animals)
+        self._materialize_soa()
         return self
+
+    # 프로세스당 1회만 워밍업하면 충분 (numba 디스패처가 컴파일 결과를 보관)
+    _kernel_warmed = False
+
+    def warm_kernel(self):
+        """
+        점수 커널 JIT 컴파일을 미리 트리거
+
+        Numba JIT은 첫 호출 시점에 컴파일되므로, 그대로 두면 배치 모드의
+        첫 사용자나 대화형 첫 추천이 컴파일 지연을 떠안는다. 데이터 로드
+        직후 1행짜리 더미 입력으로 호출해 지연을 로딩 단계로 옮긴다.
+        AOT 빌드(animal_score 모듈)가 있으면 호출해도 비용이 없다.
+        """
+        if not KERNEL_AVAILABLE or AnimalFilter._kernel_warmed:
+            return
+
+        one = np.zeros(1, dtype=np.float32)
+        _score_all_kernel(
+            one, one, np.zeros((1, 1), dtype=np.float32),
+            np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.uint64),
+            one, one, np.zeros(8, dtype=np.float32),
+            np.ones(5, dtype=np.bool_), np.ones(5, dtype=np.float32))
+        AnimalFilter._kernel_warmed = True
+
+    @staticmethod
+    def _downcast_columns(animals: pd.DataFrame) -> pd.DataFrame:
+        """
+        수치/저카디널리티 컬럼의 폭 축소
+
+        age/weight는 0~100 범위라 float64의 절반 폭(float32)이면 충분하고,
+        필터/점수 패스가 메모리 대역폭에 묶여 있어 폭을 줄이면 그만큼 빨라진다.
+        전처리기가 이미 정수형(Int16 등)으로 내린 컬럼은 float 변환이
+        오히려 폭을 넓히고 표시도 '6세'→'6.0세'로 바꾸므로 그대로 둔다.
+        gender/care_type은 category로, neutered는 미상(None)을 보존하는
+        nullable boolean으로 변환한다.
+        """
+        if len(animals) == 0:
+            return animals
+
+        # 호출자 프레임을 그대로 재타이핑하지 않도록 얕은 사본에 적용
+        animals = animals.copy(deep=False)
+
+        for col in ('age', 'weight'):
+            if col in animals.columns and \
+                    not pd.api.types.is_integer_dtype(animals[col]):
+                animals[col] = pd.to_numeric(
+                    animals[col], errors='coerce').astype('float32')
+
+        if 'neutered' in animals.columns:
+            animals['neutered'] = animals['neutered'].astype('boolean')
+
+        for col in ('gender', 'care_type'):
+            if col in animals.columns:
+                animals[col] = animals[col].astype('category')
+
+        return animals
+
+    def _materialize_soa(self):
+        """
+        중첩 dict 컬럼(care_conditions/behavior_traits/health_info)을
+        평탄한 ndarray(SoA)로 1회 전개
+
+        필터마다 행 단위 dict 조회를 반복하는 대신, 데이터 설정 시점에
+        컬럼별 배열로 펼쳐두고 이후 필터는 벡터 비교만 수행한다.
+        """
+        n = len(self.animals)
+        has_nested = n > 0 and 'care_conditions' in self.animals.columns
+
+        # 저카디널리티 문자열 컬럼을 정수 코드로 인코딩 (isin을 int 비교로)
+        self._cat_codes = {}
+        self._cat_index = {}
+        for col in ('status', 'gender', 'care_type', 'rescue_location'):
+            if n > 0 and col in self.animals.columns:
+                codes, categories = pd.factorize(self.animals[col])
+                self._cat_codes[col] = codes.astype(np.int16)
+                self._cat_index[col] = {value: i for i, value in enumerate(categories)}
+            else:
+                self._cat_codes[col] = np.empty(0, dtype=np.int16)
+                self._cat_index[col] = {}
+
+        # 임보가능 부분집합은 모든 필터/추천의 시작점이므로 1회만 계산
+        self._available_mask = self._codes_mask('status', ('임보가능',))
+        self._available_idx = np.flatnonzero(self._available_mask)
+        self._available = self.animals.iloc[self._available_idx] if n > 0 else self.animals
+
+        # 선호 프로필별 점수 캐시 (데이터 교체 시 무효화)
+        self._score_cache = {}
+
+        # 지역×임보종류 조합 조회 캐시 (대화형에서 자주 토글되는 조합)
+        if n > 0 and 'rescue_location' in self.animals.columns and \
+                'care_type' in self.animals.columns:
+            self._region_care_index = self._available.groupby(
+                ['rescue_location', 'care_type'], sort=False).indices
+        else:
+            self._region_care_index = {}
+
+        # 임보 조건
+        if has_nested:
+            cc = self.animals['care_conditions'].to_numpy(dtype=object)
+        else:
+            cc = np.empty(0, dtype=object)
+        self._cc_valid = np.fromiter(
+            (isinstance(x, dict) for x in cc), dtype=bool, count=len(cc))
+        self._cc_region = np.array(
+            [x.get('region') if isinstance(x, dict) else None for x in cc], dtype=object)
+        self._cc_duration = np.array(
+            [x.get('duration') if isinstance(x, dict) and x.get('duration') is not None else np.nan
+             for x in cc], dtype=np.float32)
+        self._cc_pickup = np.array(
+            [x.get('pickup') if isinstance(x, dict) else None for x in cc], dtype=object)
+        # 제외 조건 검사용 소문자 문자열 (falsy 값은 빈 문자열로 통일)
+        self._cc_additional_lower = np.array(
+            [str(x.get('additional_conditions')).lower()
+             if isinstance(x, dict) and x.get('additional_conditions') else ''
+             for x in cc], dtype=object)
+        self._cc_suitable_homes = np.empty(len(cc), dtype=object)
+        for i, x in enumerate(cc):
+            homes = x.get('suitable_homes') if isinstance(x, dict) else None
+            self._cc_suitable_homes[i] = tuple(homes) if homes else ()
+
+        # 행동 특성 (키별 float32 열, 결측은 NaN)
+        if has_nested and 'behavior_traits' in self.animals.columns:
+            bt = self.animals['behavior_traits'].to_numpy(dtype=object)
+        else:
+            bt = np.empty(0, dtype=object)
+        self._bt_valid = np.fromiter(
+            (isinstance(d, dict) for d in bt), dtype=bool, count=len(bt))
+        self._behavior_cols = {}
+        if n > 0 and all(key in self.animals.columns for key in BEHAVIOR_TRAIT_KEYS):
+            # 전처리기가 내보낸 평탄 Int8 컬럼을 그대로 사용 — dict 전개 불필요
+            for key in BEHAVIOR_TRAIT_KEYS:
+                self._behavior_cols[key] = self.animals[key].to_numpy(
+                    dtype=np.float32, na_value=np.nan)
+        else:
+            # 평탄 컬럼이 없는 프레임(외부 제공 등)은 dict에서 전개
+            for key in BEHAVIOR_TRAIT_KEYS:
+                col = np.full(len(bt), np.nan, dtype=np.float32)
+                for i, d in enumerate(bt):
+                    if isinstance(d, dict):
+                        v = d.get(key)
+                        if v is not None and not (isinstance(v, float) and np.isnan(v)):
+                            col[i] = v
+                self._behavior_cols[key] = col
+
+        # 해시태그: 정확 일치용 frozenset과 부분 일치용 결합 문자열을 미리 생성
+        if n > 0 and 'hashtags' in self.animals.columns:
+            ht = self.animals['hashtags'].to_numpy(dtype=object)
+        else:
+            ht = np.empty(0, dtype=object)
+        self._hashtag_sets = np.empty(len(ht), dtype=object)
+        self._hashtag_joined = np.empty(len(ht), dtype=object)
+        for i, tags in enumerate(ht):
+            tags = tags if isinstance(tags, (list, tuple)) else ()
+            self._hashtag_sets[i] = frozenset(tags)
+            # 태그 경계를 넘는 오탐을 막기 위해 NUL로 구분
+            self._hashtag_joined[i] = '\x00'.join(tags)
+
+        # 해시태그 어휘 사전 + 고정폭 비트셋 — 태그마다 비트 하나를 배정해
+        # 정확 일치 판정을 uint64 AND(+popcount) 몇 번으로 끝낸다
+        self._hashtag_to_id = {}
+        for tags in ht:
+            if isinstance(tags, (list, tuple)):
+                for tag in tags:
+                    if tag not in self._hashtag_to_id:
+                        self._hashtag_to_id[tag] = len(self._hashtag_to_id)
+        words = max(1, -(-len(self._hashtag_to_id) // 64))
+        self._hashtag_bits = np.zeros((len(ht), words), dtype=np.uint64)
+        for i, tags in enumerate(ht):
+            if isinstance(tags, (list, tuple)):
+                for tag in tags:
+                    tag_id = self._hashtag_to_id[tag]
+                    self._hashtag_bits[i, tag_id >> 6] |= \
+                        np.uint64(1) << np.uint64(tag_id & 63)
+
+        # 건강 정보
+        if has_nested and 'health_info' in self.animals.columns:
+            hi = self.animals['health_info'].to_numpy(dtype=object)
+        else:
+            hi = np.empty(0, dtype=object)
+        self._hi_valid = np.fromiter(
+            (isinstance(d, dict) for d in hi), dtype=bool, count=len(hi))
+        self._vax_count = np.zeros(len(hi), dtype=np.int32)
+        self._has_med_history = np.zeros(len(hi), dtype=bool)
+        self._med_history = np.empty(len(hi), dtype=object)
+        for i, d in enumerate(hi):
+            if isinstance(d, dict):
+                vax = d.get('vaccination')
+                self._vax_count[i] = len(vax) if vax else 0
+                med = d.get('medical_history')
+                # bool(nan)은 True — 기존 truthiness 판정과 동일하게 유지
+                self._has_med_history[i] = bool(med)
+                self._med_history[i] = str(med).lower() if self._has_med_history[i] else ''
+            else:
+                self._med_history[i] = ''
     
     def apply_filters(self, filter_criteria: Dict) -> pd.DataFrame:
         """
         복합 필터 적용
-        
+
+        모든 조건을 하나의 불리언 마스크로 누적한 뒤 마지막에 한 번만
+        슬라이싱하여 중간 데이터프레임 복사를 제거.
+
         Args:
             filter_criteria: 필터링 조건 딕셔너리
-            
+
         Returns:
             필터링된 동물 데이터프레임
         """
         if self.animals.empty:
             return pd.DataFrame()
-        
-        # 기본 상태 필터 (임보가능한 동물만)
-        results = self.animals[self.animals['status'] == '임보가능'].copy()
-        
-        # 각 필터 조건 적용
-        if 'region' in filter_criteria and filter_criteria['region']:
-            results = self._filter_by_region(results, filter_criteria['region'])
-        
-        if 'gender' in filter_criteria and filter_criteria['gender']:
-            results = self._filter_by_gender(results, filter_criteria['gender'])
-        
-        if 'care_type' in filter_criteria and filter_criteria['care_type']:
-            results = self._filter_by_care_type(results, filter_criteria['care_type'])
-        
-        if 'age_range' in filter_criteria and filter_criteria['age_range']:
-            results = self._filter_by_age_range(results, filter_criteria['age_range'])
-        
-        if 'weight_range' in filter_criteria and filter_criteria['weight_range']:
-            results = self._filter_by_weight_range(results, filter_criteria['weight_range'])
-        
-        if 'neutered' in filter_criteria and filter_criteria['neutered'] is not None:
-            results = self._filter_by_neutered(results, filter_criteria['neutered'])
-        
-        if 'hashtags' in filter_criteria and filter_criteria['hashtags']:
-            results = self._filter_by_hashtags(results, filter_criteria['hashtags'])
-        
-        if 'suitable_homes' in filter_criteria and filter_criteria['suitable_homes']:
-            results = self._filter_by_suitable_homes(results, filter_criteria['suitable_homes'])
-        
-        if 'behavior_traits' in filter_criteria and filter_criteria['behavior_traits']:
-            results = self._filter_by_behavior_traits(results, filter_criteria['behavior_traits'])
-        
-        if 'health_requirements' in filter_criteria and filter_criteria['health_requirements']:
-            results = self._filter_by_health_requirements(results, filter_criteria['health_requirements'])
-        
-        if 'care_preferences' in filter_criteria and filter_criteria['care_preferences']:
-            results = self._filter_by_care_preferences(results, filter_criteria['care_preferences'])
-        
+
+        mask = self.compute_filter_mask(filter_criteria)
+
+        # 마지막에 한 번만 구체화 — take가 이미 새 프레임을 만들므로 copy() 불필요
+        results = self.animals.take(np.flatnonzero(mask))
+
         self.filtered_results = results
         return results
-    
-    def _filter_by_region(self, animals: pd.DataFrame, regions: Union[str, List[str]]) -> pd.DataFrame:
-        """지역별 필터링"""
+
+    def compute_filter_mask(self, filter_criteria: Dict) -> np.ndarray:
+        """
+        복합 필터 조건을 전체 동물 기준 불리언 마스크로 계산
+
+        apply_filters의 본체이자 배치 모드용 진입점. 프레임을 구체화하지
+        않으므로, 같은 데이터에 여러 사용자의 하드 필터를 돌릴 때
+        set_animals로 SoA 배열을 재구축하지 않고 이 마스크를
+        apply_soft_filtering(mask=...)에 그대로 넘기면 된다.
+        """
+        animals = self.animals
+
+        # 기본 상태 필터 (임보가능한 동물만) — set_animals에서 캐시한 마스크 재사용
+        mask = self._available_mask.copy()
+
+        regions = filter_criteria.get('region')
+        care_types = filter_criteria.get('care_type')
+        combined_region_care = bool(regions) and bool(care_types)
+        if combined_region_care:
+            # 자주 토글되는 조합은 groupby 인덱스 캐시로 O(적중 수) 조회
+            mask &= self._mask_by_region_and_care_type(regions, care_types)
+
+        # 선택도 추정치 오름차순으로 적용 — 좁혀진 마스크를 받는 술어
+        # (hashtags/care_preferences/suitable_homes)일수록 평가 대상이 줄어듦
+        criteria = sorted(
+            (key for key in filter_criteria if key in self._FILTER_SELECTIVITY_HINT),
+            key=self._FILTER_SELECTIVITY_HINT.__getitem__)
+
+        for key in criteria:
+            # 이미 전부 탈락했으면 남은 술어는 평가할 필요가 없음
+            if not mask.any():
+                break
+            value = filter_criteria[key]
+            if value is None or (key != 'neutered' and not value):
+                continue
+            if key in ('region', 'care_type'):
+                if combined_region_care:
+                    continue
+                mask &= self._mask_by_region(value) if key == 'region' \
+                    else self._mask_by_care_type(value)
+            elif key == 'gender':
+                mask &= self._mask_by_gender(value)
+            elif key == 'age_range':
+                mask &= self._mask_by_age_range(animals, value)
+            elif key == 'weight_range':
+                mask &= self._mask_by_weight_range(animals, value)
+            elif key == 'neutered':
+                mask &= self._mask_by_neutered(animals, value)
+            elif key == 'behavior_traits':
+                mask &= self._mask_by_behavior_traits(value)
+            elif key == 'health_requirements':
+                mask &= self._mask_by_health_requirements(value)
+            elif key == 'care_preferences':
+                mask &= self._mask_by_care_preferences(value, mask)
+            elif key == 'hashtags':
+                mask &= self._mask_by_hashtags(value, mask)
+            elif key == 'suitable_homes':
+                self._narrow_by_predicate(
+                    self._cc_suitable_homes,
+                    self._suitable_homes_predicate(value), mask)
+
+        return mask
+
+    @staticmethod
+    def _narrow_by_predicate(values: Union[pd.Series, np.ndarray], predicate,
+                             mask: np.ndarray) -> np.ndarray:
+        """이미 탈락한 행은 건너뛰고 남은 행에만 행 단위 술어를 평가해 마스크를 좁힘"""
+        alive = np.flatnonzero(mask)
+        if alive.size == 0:
+            return mask
+
+        arr = values.to_numpy(dtype=object) if isinstance(values, pd.Series) else values
+        for pos in alive:
+            if not predicate(arr[pos]):
+                mask[pos] = False
+        return mask
+
+    def _codes_mask(self, column: str, wanted: Union[List[str], Tuple[str, ...]]) -> np.ndarray:
+        """정수 코드 배열 비교로 문자열 isin과 동일한 마스크 생성"""
+        index = self._cat_index[column]
+        codes = self._cat_codes[column]
+
+        wanted_codes = [index[value] for value in wanted if value in index]
+        if not wanted_codes:
+            return np.zeros(len(codes), dtype=bool)
+        if len(wanted_codes) == 1:
+            return codes == wanted_codes[0]
+        return np.isin(codes, np.array(wanted_codes, dtype=np.int16))
+
+    def _mask_by_region(self, regions: Union[str, List[str]]) -> np.ndarray:
+        """지역별 마스크 (임보조건이 '전국'인 동물 포함)"""
         if isinstance(regions, str):
             regions = [regions]
-        
-        return animals[
-            animals['rescue_location'].isin(regions) | 
-            animals['care_conditions'].apply(lambda x: x.get('region') == '전국' if isinstance(x, dict) else False)
-        ]
-    
-    def _filter_by_gender(self, animals: pd.DataFrame, genders: Union[str, List[str]]) -> pd.DataFrame:
-        """성별 필터링"""
+
+        return self._codes_mask('rescue_location', regions) | (self._cc_region == '전국')
+
+    def _mask_by_region_and_care_type(self, regions: Union[str, List[str]],
+                                      care_types: Union[str, List[str]]) -> np.ndarray:
+        """지역×임보종류 조합 마스크 — 캐시된 groupby 인덱스의 합집합 조회"""
+        if isinstance(regions, str):
+            regions = [regions]
+        if isinstance(care_types, str):
+            care_types = [care_types]
+
+        mask = np.zeros(len(self.animals), dtype=bool)
+        for region in regions:
+            for care_type in care_types:
+                positions = self._region_care_index.get((region, care_type))
+                if positions is not None:
+                    mask[self._available_idx[positions]] = True
+
+        # 임보조건이 '전국'인 동물은 지역과 무관하게 포함
+        mask |= (self._cc_region == '전국') & self._mask_by_care_type(care_types)
+        return mask
+
+    def _mask_by_gender(self, genders: Union[str, List[str]]) -> np.ndarray:
+        """성별 마스크"""
         if isinstance(genders, str):
             genders = [genders]
-        return animals[animals['gender'].isin(genders)]
-    
-    def _filter_by_care_type(self, animals: pd.DataFrame, care_types: Union[str, List[str]]) -> pd.DataFrame:
-        """임보 종류 필터링"""
+        return self._codes_mask('gender', genders)
+
+    def _mask_by_care_type(self, care_types: Union[str, List[str]]) -> np.ndarray:
+        """임보 종류 마스크"""
         if isinstance(care_types, str):
             care_types = [care_types]
-        return animals[animals['care_type'].isin(care_types)]
-    
-    def _filter_by_age_range(self, animals: pd.DataFrame, age_range: Dict[str, int]) -> pd.DataFrame:
-        """나이 범위 필터링"""
+        return self._codes_mask('care_type', care_types)
+
+    def _mask_by_age_range(self, animals: pd.DataFrame, age_range: Dict[str, int]) -> np.ndarray:
+        """나이 범위 마스크 (ndarray 벡터 연산)"""
         min_age = age_range.get('min', 0)
         max_age = age_range.get('max', 100)
-        
-        return animals[
-            (animals['age'] >= min_age) & 
-            (animals['age'] <= max_age) & 
-            animals['age'].notna()
-        ]
-    
-    def _filter_by_weight_range(self, animals: pd.DataFrame, weight_range: Dict[str, float]) -> pd.DataFrame:
-        """몸무게 범위 필터링"""
+
+        arr = animals['age'].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _range_mask(arr, float(min_age), float(max_age))
+
+    def _mask_by_weight_range(self, animals: pd.DataFrame, weight_range: Dict[str, float]) -> np.ndarray:
+        """몸무게 범위 마스크 (ndarray 벡터 연산)"""
         min_weight = weight_range.get('min', 0)
         max_weight = weight_range.get('max', 100)
-        
-        return animals[
-            (animals['weight'] >= min_weight) & 
-            (animals['weight'] <= max_weight) & 
-            animals['weight'].notna()
-        ]
-    
-    def _filter_by_neutered(self, animals: pd.DataFrame, neutered: bool) -> pd.DataFrame:
-        """중성화 여부 필터링"""
-        return animals[animals['neutered'] == neutered]
-    
-    def _filter_by_hashtags(self, animals: pd.DataFrame, required_hashtags: List[str]) -> pd.DataFrame:
-        """해시태그 필터링 (OR 조건)"""
-        def has_matching_hashtag(hashtags):
-            if not hashtags:
-                return False
-            return any(
-                any(tag in animal_tag or animal_tag in tag for animal_tag in hashtags)
-                for tag in required_hashtags
-            )
-        
-        return animals[animals['hashtags'].apply(has_matching_hashtag)]
-    
-    def _filter_by_suitable_homes(self, animals: pd.DataFrame, home_types: List[str]) -> pd.DataFrame:
-        """적합한 가정 유형 필터링"""
-        def matches_home_type(care_conditions):
-            if not isinstance(care_conditions, dict) or 'suitable_homes' not in care_conditions:
-                return False
-            suitable_homes = care_conditions['suitable_homes']
+
+        arr = animals['weight'].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _range_mask(arr, float(min_weight), float(max_weight))
+
+    def _mask_by_neutered(self, animals: pd.DataFrame, neutered: bool) -> np.ndarray:
+        """중성화 여부 마스크 (미상은 제외)"""
+        return (animals['neutered'] == neutered).to_numpy(dtype=bool, na_value=False)
+
+    def _mask_by_hashtags(self, required_hashtags: List[str],
+                          current_mask: np.ndarray) -> np.ndarray:
+        """
+        해시태그 마스크 (OR 조건)
+
+        정확 일치는 해시태그 비트셋에 대한 uint64 AND 한 번으로 전 행을
+        일괄 판정하고, 남은 행만 부분 문자열 검사로 내려간다.
+        pyahocorasick이 있으면 요청 태그들을 하나의 오토마톤으로 컴파일해
+        동물별 결합 문자열을 단일 선형 스캔으로 검사한다. 이미 탈락한
+        행은 건너뛴다.
+        """
+        required_set = frozenset(required_hashtags)
+        n = len(self._hashtag_sets)
+        mask = np.zeros(n, dtype=bool)
+        alive = np.flatnonzero(current_mask)
+
+        # 요청 태그 중 하나라도 보유 = AND 결과에 살아남은 비트 존재
+        q_bits = self._encode_query_bits(required_set)
+        exact = (self._hashtag_bits & q_bits).any(axis=1)
+        mask[alive] = exact[alive]
+        alive = alive[~exact[alive]]
+
+        # 요청 태그 → 멀티 패턴 오토마톤 (요청 태그 ⊂ 동물 태그 방향)
+        automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for i, tag in enumerate(required_hashtags):
+                automaton.add_word(tag, i)
+            automaton.make_automaton()
+
+        for pos in alive:
+            tag_set = self._hashtag_sets[pos]
+            if not tag_set:
+                continue
+            joined = self._hashtag_joined[pos]
+            if automaton is not None:
+                contains_required = next(automaton.iter(joined), None) is not None
+            else:
+                contains_required = any(tag in joined for tag in required_hashtags)
+            if contains_required or \
+                    any(animal_tag in tag
+                        for tag in required_hashtags for animal_tag in tag_set):
+                mask[pos] = True
+
+        return mask
+
+    @staticmethod
+    def _suitable_homes_predicate(home_types: List[str]):
+        """적합한 가정 유형 술어 생성 (SoA 튜플 기반)"""
+        def matches_home_type(suitable_homes):
             if not suitable_homes:
                 return False
             return any(
-                any(home_type in suitable_home or suitable_home in home_type 
+                any(home_type in suitable_home or suitable_home in home_type
                     for suitable_home in suitable_homes)
                 for home_type in home_types
             )
-        
-        return animals[animals['care_conditions'].apply(matches_home_type)]
-    
-    def _filter_by_behavior_traits(self, animals: pd.DataFrame, trait_requirements: Dict) -> pd.DataFrame:
-        """행동 특성 필터링"""
-        def meets_behavior_requirements(behavior_traits):
-            if not isinstance(behavior_traits, dict):
-                return False
-            
-            for trait_name, requirement in trait_requirements.items():
-                animal_value = behavior_traits.get(trait_name)
-                
-                if animal_value is None:
-                    continue
-                
-                # 범위 조건 (min, max)
-                if 'min' in requirement and animal_value < requirement['min']:
-                    return False
-                if 'max' in requirement and animal_value > requirement['max']:
-                    return False
-                
-                # 정확한 값 조건
-                if 'exact' in requirement and animal_value != requirement['exact']:
-                    return False
-            
-            return True
-        
-        return animals[animals['behavior_traits'].apply(meets_behavior_requirements)]
-    
-    def _filter_by_health_requirements(self, animals: pd.DataFrame, health_reqs: Dict) -> pd.DataFrame:
-        """건강 요구사항 필터링"""
-        def meets_health_requirements(health_info):
-            if not isinstance(health_info, dict):
-                return False
-            
-            # 예방접종 완성도 확인
-            if 'min_vaccinations' in health_reqs and health_info.get('vaccination'):
-                vaccination_count = len(health_info['vaccination'])
-                if vaccination_count < health_reqs['min_vaccinations']:
-                    return False
-            
-            # 병력이 없는 동물만 원하는 경우
-            if health_reqs.get('no_medical_history', False) and health_info.get('medical_history'):
-                return False
-            
-            # 특정 질병 제외
-            if 'exclude_conditions' in health_reqs and health_info.get('medical_history'):
-                medical_history = str(health_info['medical_history']).lower()
-                has_excluded_condition = any(
-                    condition.lower() in medical_history
-                    for condition in health_reqs['exclude_conditions']
-                )
-                if has_excluded_condition:
-                    return False
-            
-            return True
-        
-        return animals[animals['health_info'].apply(meets_health_requirements)]
-    
-    def _filter_by_care_preferences(self, animals: pd.DataFrame, care_prefs: Dict) -> pd.DataFrame:
-        """임보 조건 선호도 필터링"""
-        def meets_care_preferences(care_conditions):
-            if not isinstance(care_conditions, dict):
-                return False
-            
-            # 임보 기간 조건
-            if 'max_duration' in care_prefs and care_conditions.get('duration'):
-                if care_conditions['duration'] > care_prefs['max_duration']:
-                    return False
-            
-            # 픽업 방식 조건
-            if 'pickup_method' in care_prefs and care_conditions.get('pickup'):
-                if care_prefs['pickup_method'] not in care_conditions['pickup']:
-                    return False
-            
-            # 추가 조건 제외 사항
-            if 'exclude_conditions' in care_prefs and care_conditions.get('additional_conditions'):
-                additional_conditions = str(care_conditions['additional_conditions']).lower()
-                has_excluded_condition = any(
-                    condition.lower() in additional_conditions
-                    for condition in care_prefs['exclude_conditions']
-                )
-                if has_excluded_condition:
-                    return False
-            
-            return True
-        
-        return animals[animals['care_conditions'].apply(meets_care_preferences)]
+        return matches_home_type
+
+    def _mask_by_behavior_traits(self, trait_requirements: Dict) -> np.ndarray:
+        """행동 특성 마스크 (SoA 열별 벡터 비교)"""
+        mask = self._bt_valid.copy()
+
+        for trait_name, requirement in trait_requirements.items():
+            col = self._behavior_cols.get(trait_name)
+            if col is None:
+                continue
+
+            # 결측값(NaN)은 조건 미적용으로 통과
+            missing = np.isnan(col)
+
+            ok = np.ones(len(col), dtype=bool)
+            if 'min' in requirement:
+                ok &= col >= requirement['min']
+            if 'max' in requirement:
+                ok &= col <= requirement['max']
+            if 'exact' in requirement:
+                ok &= col == requirement['exact']
+
+            mask &= ok | missing
+
+        return mask
+
+    def _mask_by_health_requirements(self, health_reqs: Dict) -> np.ndarray:
+        """건강 요구사항 마스크 (SoA 벡터 비교)"""
+        mask = self._hi_valid.copy()
+
+        # 예방접종 완성도 확인 (접종 기록이 있는 동물만 판정)
+        if 'min_vaccinations' in health_reqs:
+            mask &= ~((self._vax_count > 0) &
+                      (self._vax_count < health_reqs['min_vaccinations']))
+
+        # 병력이 없는 동물만 원하는 경우
+        if health_reqs.get('no_medical_history', False):
+            mask &= ~self._has_med_history
+
+        # 특정 질병 제외 — 제외어들을 하나의 교대 정규식으로 묶어 단일 패스 검사
+        if 'exclude_conditions' in health_reqs:
+            pattern = '|'.join(
+                re.escape(c.lower()) for c in health_reqs['exclude_conditions'])
+            if pattern:
+                contains = pd.Series(self._med_history).str.contains(
+                    pattern, regex=True, na=False).to_numpy()
+                mask &= ~(self._has_med_history & contains)
+
+        return mask
+
+    def _mask_by_care_preferences(self, care_prefs: Dict, current_mask: np.ndarray) -> np.ndarray:
+        """임보 조건 선호도 마스크 (SoA 벡터 비교, 임보 조건이 dict가 아니면 제외)"""
+        mask = self._cc_valid.copy()
+
+        # 임보 기간 조건 (기간 미기재는 통과)
+        if 'max_duration' in care_prefs:
+            duration = self._cc_duration
+            has_duration = ~np.isnan(duration) & (duration != 0)
+            mask &= ~(has_duration & (duration > care_prefs['max_duration']))
+
+        # 픽업 방식 조건
+        if 'pickup_method' in care_prefs:
+            method = care_prefs['pickup_method']
+            for pos in np.flatnonzero(mask & current_mask):
+                pickup = self._cc_pickup[pos]
+                if pickup and method not in pickup:
+                    mask[pos] = False
+
+        # 추가 조건 제외 사항 — 제외어들을 하나의 교대 정규식으로 묶어 단일 패스 검사
+        if 'exclude_conditions' in care_prefs:
+            pattern = '|'.join(
+                re.escape(c.lower()) for c in care_prefs['exclude_conditions'])
+            if pattern:
+                contains = pd.Series(self._cc_additional_lower).str.contains(
+                    pattern, regex=True, na=False).to_numpy()
+                mask &= ~contains
+
+        return mask
     
-    def apply_soft_filtering(self, preferences: Dict, threshold: float = 0.3) -> pd.DataFrame:
+    def apply_soft_filtering(self, preferences: Dict, threshold: float = 0.3,
+                             mask: Optional[np.ndarray] = None) -> pd.DataFrame:
         """
         점수 기반 소프트 필터링 (추천 시스템용)
-        
+
         Args:
             preferences: 사용자 선호도 (가중치 포함)
             threshold: 최소 점수 임계값
-            
+            mask: compute_filter_mask가 만든 불리언 마스크. 주어지면
+                set_animals로 데이터를 교체하지 않고 마스크가 가리키는
+                행만 점수를 계산한다 (배치 모드에서 SoA 재구축 생략).
+
         Returns:
             점수순으로 정렬된 동물 데이터프레임
         """
-        available_animals = self.animals[self.animals['status'] == '임보가능'].copy()
-        
-        if available_animals.empty:
+        available_idx = self._available_idx if mask is None else np.flatnonzero(mask)
+
+        if available_idx.size == 0:
             return pd.DataFrame()
-        
-        # 각 동물에 대해 매치 점수 계산
-        match_scores = []
-        for idx, animal in available_animals.iterrows():
-            score = self._calculate_match_score(animal, preferences)
-            match_scores.append(score)
-        
-        available_animals['match_score'] = match_scores
-        
-        # 임계값 이상인 동물만 필터링하고 점수순으로 정렬
-        filtered_animals = available_animals[available_animals['match_score'] >= threshold]
-        self.filtered_results = filtered_animals.sort_values('match_score', ascending=False)
-        
-        return self.filtered_results
+
+        scores = self._score_cached(available_idx, preferences)
+
+        # 임계값 선별과 정렬을 인덱스/점수 배열에서 끝낸 뒤 프레임은 한 번만
+        # 구체화 — 전체 복사 → 열 추가 → 필터 복사 → 정렬 복사를 복사 1회로
+        keep = scores >= threshold
+        selected = available_idx[keep]
+        kept_scores = scores[keep]
+        # 동점 순서까지 기존 sort_values(ascending=False)와 동일하게 유지
+        # (점수 배열만 정렬하므로 프레임 복사는 발생하지 않음)
+        order = pd.Series(kept_scores).sort_values(ascending=False).index.to_numpy()
+
+        results = self.animals.take(selected[order])
+        results['match_score'] = kept_scores[order]
+
+        self.filtered_results = results
+        return results
     
-    def _calculate_match_score(self, animal: pd.Series, preferences: Dict) -> float:
-        """동물과 사용자 선호도 간 매치 점수 계산"""
-        total_score = 0
-        total_weight = 0
-        
+    def _score_cached(self, idx: np.ndarray, preferences: Dict) -> np.ndarray:
+        """
+        선호 프로필별 점수 메모이제이션
+
+        행 점수는 행 간 독립이므로, 같은 선호가 마스크만 달리해 반복되는
+        배치 모드에서는 임보가능 전체에 대한 점수를 프로필당 1회만 계산해
+        두고 이후 호출은 부분집합 인덱싱으로 끝낸다. 직렬화할 수 없는
+        선호이거나 임보가능 밖의 행이 섞여 있으면 캐시를 거치지 않는다.
+        """
+        try:
+            key = json.dumps(preferences, sort_keys=True, ensure_ascii=False)
+        except TypeError:
+            key = None
+
+        if key is None or not np.all(self._available_mask[idx]):
+            return self._score_array(idx, preferences)
+
+        base_scores = self._score_cache.get(key)
+        if base_scores is None:
+            base_scores = self._score_array(self._available_idx, preferences)
+            if len(self._score_cache) >= self._SCORE_CACHE_MAX:
+                self._score_cache.pop(next(iter(self._score_cache)))
+            self._score_cache[key] = base_scores
+
+        if idx.size == self._available_idx.size:
+            return base_scores
+        return base_scores[np.searchsorted(self._available_idx, idx)]
+
+    def _score_array(self, idx: np.ndarray, preferences: Dict) -> np.ndarray:
+        """점수 계산 경로 선택 (컴파일 커널 → 프로세스 풀 → 컬럼 폴백)"""
+        if KERNEL_AVAILABLE:
+            # SoA 배열 기반 컴파일 커널로 전체 점수를 한 번에 계산
+            return self._score_with_kernel(idx, preferences)
+        if JOBLIB_AVAILABLE and idx.size >= PARALLEL_MIN_SIZE:
+            # 커널 부재 + 대량 데이터: 청크를 프로세스 풀에 분배
+            return self._score_parallel(idx, preferences)
+        # 폴백: 열 단위 배열에서 원시 값만 꺼내 행별 점수 계산
+        return self._score_columnar(idx, preferences)
+
+    def _score_with_kernel(self, idx: np.ndarray, preferences: Dict) -> np.ndarray:
+        """선호도를 배열 인자로 패킹해 Numba 커널로 매치 점수 계산"""
+        n = idx.size
         weights = preferences.get('weights', {})
-        
-        # 지역 매치
+
+        flags = np.zeros(5, dtype=np.bool_)
+        comp_weights = np.ones(5, dtype=np.float32)
+        params = np.array([0, 100, 0, 100, 0, 100, 0, 100], dtype=np.float32)
+
+        # 지역 선호 → 불리언 조회 배열
         if 'region' in preferences:
-            weight = weights.get('region', 1)
-            score = self._calculate_region_score(animal, preferences['region'])
-            total_score += score * weight
-            total_weight += weight
-        
-        # 나이 매치
+            flags[0] = True
+            comp_weights[0] = weights.get('region', 1)
+            region_scores = self._mask_by_region(
+                list(preferences['region']))[idx].astype(np.float32)
+        else:
+            region_scores = np.zeros(n, dtype=np.float32)
+
+        # 나이/크기 선호 → 경계값 패킹
         if 'age_preference' in preferences:
-            weight = weights.get('age', 1)
-            score = self._calculate_age_score(animal, preferences['age_preference'])
-            total_score += score * weight
-            total_weight += weight
-        
-        # 크기 매치
+            flags[1] = True
+            comp_weights[1] = weights.get('age', 1)
+            preferred = preferences['age_preference'].get('preferred', {})
+            acceptable = preferences['age_preference'].get('acceptable', {})
+            params[0:4] = [preferred.get('min', 0), preferred.get('max', 100),
+                           acceptable.get('min', 0), acceptable.get('max', 100)]
+
         if 'size_preference' in preferences:
-            weight = weights.get('size', 1)
-            score = self._calculate_size_score(animal, preferences['size_preference'])
-            total_score += score * weight
-            total_weight += weight
-        
-        # 성격 매치
+            flags[2] = True
+            comp_weights[2] = weights.get('size', 1)
+            preferred = preferences['size_preference'].get('preferred', {})
+            acceptable = preferences['size_preference'].get('acceptable', {})
+            params[4:8] = [preferred.get('min', 0), preferred.get('max', 100),
+                           acceptable.get('min', 0), acceptable.get('max', 100)]
+
+        # 성격 선호 → 해시태그 매칭 점수 (비트셋 popcount, 문자열 폴백은 커널 밖에서)
         if 'personality_traits' in preferences:
-            weight = weights.get('personality', 1)
-            score = self._calculate_personality_score(animal, preferences['personality_traits'])
-            total_score += score * weight
-            total_weight += weight
-        
-        # 행동 특성 매치
+            flags[3] = True
+            comp_weights[3] = weights.get('personality', 1)
+            personality_scores = self._personality_scores(
+                idx, preferences['personality_traits'])
+        else:
+            personality_scores = np.zeros(n, dtype=np.float32)
+
+        # 행동 특성 선호 → (N, K) 행렬 + 이상값/허용 비트마스크
+        behavior_prefs = preferences.get('behavior_preferences', {})
+        used_traits = [t for t in behavior_prefs if t in self._behavior_cols]
+        # 키 존재 여부로 판단 (빈 dict도 유효 특성 0개 → 중간 점수 0.5로 집계)
         if 'behavior_preferences' in preferences:
-            weight = weights.get('behavior', 1)
-            score = self._calculate_behavior_score(animal, preferences['behavior_preferences'])
-            total_score += score * weight
-            total_weight += weight
-        
-        return total_score / total_weight if total_weight > 0 else 0
-    
-    def _calculate_region_score(self, animal: pd.Series, preferred_regions: List[str]) -> float:
-        """지역 점수 계산"""
-        care_conditions = animal.get('care_conditions', {})
-        if isinstance(care_conditions, dict) and care_conditions.get('region') == '전국':
-            return 1.0
-        if animal.get('rescue_location') in preferred_regions:
-            return 1.0
-        return 0.0
-    
-    def _calculate_age_score(self, animal: pd.Series, age_preference: Dict) -> float:
-        """나이 점수 계산"""
-        age = animal.get('age')
-        if pd.isna(age):
-            return 0.5  # 나이 불명인 경우 중간 점수
-        
-        preferred = age_preference.get('preferred', {})
-        acceptable = age_preference.get('acceptable', {})
-        
-        if preferred.get('min', 0) <= age <= preferred.get('max', 100):
-            return 1.0
-        if acceptable.get('min', 0) <= age <= acceptable.get('max', 100):
-            return 0.7
-        
-        return 0.0
-    
-    def _calculate_size_score(self, animal: pd.Series, size_preference: Dict) -> float:
-        """크기 점수 계산"""
-        weight = animal.get('weight')
-        if pd.isna(weight):
-            return 0.5
-        
-        preferred = size_preference.get('preferred', {})
-        acceptable = size_preference.get('acceptable', {})
-        
-        if preferred.get('min', 0) <= weight <= preferred.get('max', 100):
-            return 1.0
-        if acceptable.get('min', 0) <= weight <= acceptable.get('max', 100):
-            return 0.7
-        
-        return 0.0
-    
-    def _calculate_personality_score(self, animal: pd.Series, personality_traits: List[str]) -> float:
-        """성격 점수 계산 (해시태그 기반)"""
-        hashtags = animal.get('hashtags', [])
-        if not hashtags:
-            return 0.5
-        
-        matches = [
-            trait for trait in personality_traits
-            if any(trait in tag or tag in trait for tag in hashtags)
-        ]
-        
-        return len(matches) / len(personality_traits) if personality_traits else 0.5
-    
-    def _calculate_behavior_score(self, animal: pd.Series, behavior_prefs: Dict) -> float:
-        """행동 특성 점수 계산"""
-        behavior_traits = animal.get('behavior_traits', {})
-        if not isinstance(behavior_traits, dict):
-            return 0.5
-        
-        total_score = 0
-        valid_traits = 0
-        
-        for trait_name, preference in behavior_prefs.items():
-            animal_value = behavior_traits.get(trait_name)
-            if pd.isna(animal_value):
+            flags[4] = True
+            comp_weights[4] = weights.get('behavior', 1)
+        if used_traits:
+            behavior_mat = np.ascontiguousarray(
+                np.column_stack([self._behavior_cols[t][idx] for t in used_traits]))
+            ideals = np.array(
+                [np.nan if behavior_prefs[t].get('ideal') is None else behavior_prefs[t]['ideal']
+                 for t in used_traits], dtype=np.float32)
+            acc_bits = np.zeros(len(used_traits), dtype=np.uint64)
+            for k, trait in enumerate(used_traits):
+                for v in behavior_prefs[trait].get('acceptable', []):
+                    if isinstance(v, (int, np.integer)) and 0 <= v < 64:
+                        acc_bits[k] |= np.uint64(1) << np.uint64(v)
+        else:
+            behavior_mat = np.empty((n, 0), dtype=np.float32)
+            ideals = np.empty(0, dtype=np.float32)
+            acc_bits = np.empty(0, dtype=np.uint64)
+
+        ages = self.animals['age'].to_numpy(dtype=np.float64, na_value=np.nan)[idx] \
+            .astype(np.float32)
+        weights_arr = self.animals['weight'].to_numpy(dtype=np.float64, na_value=np.nan)[idx] \
+            .astype(np.float32)
+
+        return _score_all_kernel(ages, weights_arr, behavior_mat, ideals, acc_bits,
+                                 region_scores, personality_scores, params, flags, comp_weights)
+
+    def _score_parallel(self, idx: np.ndarray, preferences: Dict) -> np.ndarray:
+        """
+        커널 부재 시 joblib 프로세스 풀로 청크 병렬 점수 계산
+
+        점수 계산은 행 간 의존이 없어 청크 분할이 자유롭다. 프로세스 경계의
+        직렬화 비용이 있으므로 PARALLEL_MIN_SIZE 이상일 때만 선택된다.
+        """
+        n_jobs = cpu_count()
+        chunks = np.array_split(idx, n_jobs)
+        parts = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(self._score_columnar)(chunk, preferences)
+            for chunk in chunks if chunk.size)
+        return np.concatenate(parts)
+
+    def _score_columnar(self, idx: np.ndarray, preferences: Dict) -> np.ndarray:
+        """
+        커널 폴백용 점수 계산
+
+        iterrows()가 행마다 Series를 생성하는 비용을 피해, 필요한 컬럼을
+        ndarray로 한 번만 추출하고 스칼라 값만 넘겨 행별 점수를 계산한다.
+        """
+        n = idx.size
+        weights = preferences.get('weights', {})
+
+        ages = self.animals['age'].to_numpy(dtype=np.float64, na_value=np.nan)[idx]
+        weights_arr = self.animals['weight'].to_numpy(dtype=np.float64, na_value=np.nan)[idx]
+
+        # 지역 점수는 불리언 조회 배열 한 번으로 계산 (행별 set 멤버십 제거)
+        region_scores = self._mask_by_region(
+            list(preferences['region']))[idx].astype(np.float64) \
+            if 'region' in preferences else None
+
+        behavior_scores = self._behavior_scores_matrix(
+            idx, preferences['behavior_preferences']) \
+            if 'behavior_preferences' in preferences else None
+
+        personality_scores = self._personality_scores(
+            idx, preferences['personality_traits']).astype(np.float64) \
+            if 'personality_traits' in preferences else None
+
+        age_scores = self._range_scores_array(ages, preferences['age_preference']) \
+            if 'age_preference' in preferences else None
+        size_scores = self._range_scores_array(weights_arr, preferences['size_preference']) \
+            if 'size_preference' in preferences else None
+
+        scores = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            total_score = 0.0
+            total_weight = 0.0
+
+            # 지역 매치
+            if region_scores is not None:
+                weight = weights.get('region', 1)
+                total_score += region_scores[i] * weight
+                total_weight += weight
+
+            # 나이 매치
+            if age_scores is not None:
+                weight = weights.get('age', 1)
+                total_score += age_scores[i] * weight
+                total_weight += weight
+
+            # 크기 매치
+            if size_scores is not None:
+                weight = weights.get('size', 1)
+                total_score += size_scores[i] * weight
+                total_weight += weight
+
+            # 성격 매치
+            if personality_scores is not None:
+                weight = weights.get('personality', 1)
+                total_score += personality_scores[i] * weight
+                total_weight += weight
+
+            # 행동 특성 매치
+            if behavior_scores is not None:
+                weight = weights.get('behavior', 1)
+                total_score += behavior_scores[i] * weight
+                total_weight += weight
+
+            scores[i] = total_score / total_weight if total_weight > 0 else 0.0
+
+        return scores
+
+    @staticmethod
+    def _range_scores_array(values: np.ndarray, preference: Dict) -> np.ndarray:
+        """나이/크기 공통의 선호-허용 범위 점수를 컬럼 단위로 계산 (값 불명은 중간 점수)"""
+        preferred = preference.get('preferred', {})
+        acceptable = preference.get('acceptable', {})
+        p_min, p_max = preferred.get('min', 0), preferred.get('max', 100)
+        a_min, a_max = acceptable.get('min', 0), acceptable.get('max', 100)
+
+        # numba가 있으면 KERNEL_AVAILABLE이라 이 함수까지 오지 않으므로
+        # ufunc 분기 없이 np.select 한 경로만 둔다
+        return np.select(
+            [np.isnan(values),
+             (values >= p_min) & (values <= p_max),
+             (values >= a_min) & (values <= a_max)],
+            [0.5, 1.0, 0.7],
+            default=0.0,
+        )
+
+    def _encode_query_bits(self, tags) -> np.ndarray:
+        """질의 태그 목록을 동물 비트셋과 같은 폭의 uint64 벡터로 인코딩"""
+        q_bits = np.zeros(self._hashtag_bits.shape[1], dtype=np.uint64)
+        for tag in tags:
+            tag_id = self._hashtag_to_id.get(tag)
+            if tag_id is not None:
+                q_bits[tag_id >> 6] |= np.uint64(1) << np.uint64(tag_id & 63)
+        return q_bits
+
+    def _personality_scores(self, idx: np.ndarray, personality_traits: List[str]) -> np.ndarray:
+        """
+        idx 행들의 성격 매칭 비율 계산
+
+        정확 일치한 선호 태그 수는 비트셋 AND 후 popcount로 전 행을 한 번에
+        세고(태그당 1비트), 정확 일치에서 빠진 태그가 있는 행만 부분 문자열
+        폴백으로 내려간다. 태그가 없는 동물은 중간 점수 0.5.
+        """
+        n = idx.size
+        scores = np.full(n, 0.5, dtype=np.float32)
+        if not personality_traits:
+            return scores
+
+        bits = self._hashtag_bits[idx]
+        q_bits = self._encode_query_bits(personality_traits)
+        exact_counts = _bitwise_count(bits & q_bits).sum(axis=1, dtype=np.int64)
+
+        total = len(personality_traits)
+        known = {trait: self._hashtag_to_id[trait]
+                 for trait in personality_traits if trait in self._hashtag_to_id}
+
+        for i in range(n):
+            tag_set = self._hashtag_sets[idx[i]]
+            if not tag_set:
                 continue
-            
-            ideal = preference.get('ideal')
-            acceptable = preference.get('acceptable', [])
-            
-            if animal_value == ideal:
-                total_score += 1.0
-            elif animal_value in acceptable:
-                total_score += 0.7
+            matches = int(exact_counts[i])
+            if matches < total:
+                joined = self._hashtag_joined[idx[i]]
+                for trait in personality_traits:
+                    tag_id = known.get(trait)
+                    if tag_id is not None and \
+                            (bits[i, tag_id >> 6] >> np.uint64(tag_id & 63)) & np.uint64(1):
+                        continue  # 이미 popcount에 포함됨
+                    if trait in joined or any(tag in trait for tag in tag_set):
+                        matches += 1
+            scores[i] = matches / total
+
+        return scores
+
+    def _behavior_scores_matrix(self, idx: np.ndarray, behavior_prefs: Dict) -> np.ndarray:
+        """
+        행동 특성 점수를 (N, K) 행렬 연산 한 번으로 계산
+
+        특성별 이상값 일치(1.0) / 허용 목록(0.7) / 거리 기반 점수를
+        np.where로 합성하고, 결측(NaN)을 제외한 평균을 구한다.
+        유효한 특성이 하나도 없는 동물은 중간 점수 0.5.
+        """
+        used_traits = [t for t in behavior_prefs if t in self._behavior_cols]
+        n = idx.size
+        if not used_traits:
+            return np.full(n, 0.5, dtype=np.float64)
+
+        behavior_mat = np.column_stack([self._behavior_cols[t][idx] for t in used_traits])
+        valid = ~np.isnan(behavior_mat)
+
+        trait_scores = np.empty_like(behavior_mat, dtype=np.float64)
+        for k, trait in enumerate(used_traits):
+            ideal = behavior_prefs[trait].get('ideal')
+            acceptable = behavior_prefs[trait].get('acceptable', [])
+            column = behavior_mat[:, k]
+
+            if ideal is not None:
+                distance_score = np.maximum(0.0, 1.0 - np.abs(column - ideal) / 4.0)
+                exact = column == ideal
             else:
-                # 거리 기반 점수 (1-5 스케일에서)
-                distance = abs(animal_value - ideal) if ideal is not None else 0
-                total_score += max(0, 1 - distance / 4)
-            
-            valid_traits += 1
-        
-        return total_score / valid_traits if valid_traits > 0 else 0.5
+                distance_score = np.ones(n, dtype=np.float64)
+                exact = np.zeros(n, dtype=bool)
+
+            accepted = np.isin(column, list(acceptable)) if acceptable else np.zeros(n, dtype=bool)
+            trait_scores[:, k] = np.where(exact, 1.0, np.where(accepted, 0.7, distance_score))
+
+        valid_counts = valid.sum(axis=1)
+        totals = np.where(valid, trait_scores, 0.0).sum(axis=1)
+        return np.where(valid_counts > 0, totals / np.maximum(valid_counts, 1), 0.5)
     
+    def get_available(self) -> pd.DataFrame:
+        """임보가능 부분집합 (set_animals 시점에 계산된 캐시)"""
+        return self._available
+
     def get_results(self) -> pd.DataFrame:
         """필터 결과 가져오기"""
         return self.filtered_results
@@ -404,42 +1055,41 @@ class AnimalFilter:
             return {'total_count': 0}
         
         results = self.filtered_results
+
+        # 나이 분포 계산 (pd.cut으로 C 레벨 단일 패스 비닝)
+        age_bins = pd.cut(
+            results['age'], bins=[-np.inf, 1, 3, 7, np.inf],
+            labels=['1세 이하', '1-3세', '4-7세', '8세 이상'])
+        age_distribution = {
+            str(label): int(count)
+            for label, count in age_bins.value_counts().items() if count > 0
+        }
+        age_missing = int(results['age'].isna().sum())
+        if age_missing:
+            age_distribution['나이 불명'] = age_missing
+
+        # 몸무게 분포 계산 (5kg 미만/15kg 이하 경계가 비대칭이라 np.select 사용)
+        weights = results['weight'].to_numpy(dtype=np.float64, na_value=np.nan)
+        weight_labels = np.select(
+            [np.isnan(weights), weights < 5, weights <= 15],
+            ['몸무게 불명', '소형견', '중형견'], default='대형견')
+        labels, counts = np.unique(weight_labels, return_counts=True)
+        weight_distribution = {str(label): int(count) for label, count in zip(labels, counts)}
         
-        # 나이 분포 계산
-        def categorize_age(age):
-            if pd.isna(age):
-                return '나이 불명'
-            elif age <= 1:
-                return '1세 이하'
-            elif age <= 3:
-                return '1-3세'
-            elif age <= 7:
-                return '4-7세'
-            else:
-                return '8세 이상'
-        
-        age_distribution = results['age'].apply(categorize_age).value_counts().to_dict()
-        
-        # 몸무게 분포 계산
-        def categorize_weight(weight):
-            if pd.isna(weight):
-                return '몸무게 불명'
-            elif weight < 5:
-                return '소형견'
-            elif weight <= 15:
-                return '중형견'
-            else:
-                return '대형견'
-        
-        weight_distribution = results['weight'].apply(categorize_weight).value_counts().to_dict()
-        
+        # category 열의 value_counts는 결과에 없는 범주도 0으로 내놓으므로
+        # 나이 분포와 같은 기준으로 0 카운트 항목을 제외
+        def _nonzero_counts(counts: pd.Series) -> Dict:
+            return {str(label): int(count)
+                    for label, count in counts.items() if count > 0}
+
         return {
             'total_count': len(results),
-            'gender_distribution': results['gender'].value_counts().to_dict(),
+            'gender_distribution': _nonzero_counts(results['gender'].value_counts()),
             'age_distribution': age_distribution,
             'weight_distribution': weight_distribution,
-            'care_type_distribution': results['care_type'].value_counts().to_dict(),
-            'region_distribution': results['rescue_location'].value_counts().head(10).to_dict()
+            'care_type_distribution': _nonzero_counts(results['care_type'].value_counts()),
+            'region_distribution': _nonzero_counts(
+                results['rescue_location'].value_counts().head(10))
         }
     
     def get_top_matches(self, n: int = 10) -> pd.DataFrame:
@@ -449,27 +1099,35 @@ class AnimalFilter:
         else:
             return self.filtered_results.head(n)
     
+    def _export_frame(self, results: pd.DataFrame) -> pd.DataFrame:
+        """내보내기용 평탄 프레임 구성 (열 선택 + 해시태그 결합)"""
+        # 열 선택 + 해시태그 결합만 필요하므로 행 단위 dict 생성 없이 처리
+        export = results.reindex(
+            columns=['id', 'name', 'gender', 'age', 'weight',
+                     'care_type', 'rescue_location']).copy()
+        if 'hashtags' in results.columns:
+            export['hashtags'] = ['|'.join(tags) if tags is not None else ''
+                                  for tags in results['hashtags']]
+        else:
+            export['hashtags'] = ''
+        export['match_score'] = results['match_score'] \
+            if 'match_score' in results.columns else 0
+        export['detail_link'] = results['detail_link'] \
+            if 'detail_link' in results.columns else ''
+        return export
+
     def export_results(self, filename: str):
         """결과를 CSV 파일로 내보내기"""
         if not self.filtered_results.empty:
-            # 복잡한 구조를 평탄화하여 CSV로 저장
-            export_data = []
-            for idx, row in self.filtered_results.iterrows():
-                export_row = {
-                    'id': row.get('id'),
-                    'name': row.get('name'),
-                    'gender': row.get('gender'),
-                    'age': row.get('age'),
-                    'weight': row.get('weight'),
-                    'care_type': row.get('care_type'),
-                    'rescue_location': row.get('rescue_location'),
-                    'hashtags': '|'.join(row.get('hashtags', [])),
-                    'match_score': row.get('match_score', 0),
-                    'detail_link': row.get('detail_link', '')
-                }
-                export_data.append(export_row)
-            
-            pd.DataFrame(export_data).to_csv(filename, index=False, encoding='utf-8')
+            export = self._export_frame(self.filtered_results)
+
+            if PYARROW_AVAILABLE:
+                # C 구현 멀티스레드 직렬화 — 배치 모드의 사용자별 내보내기에서
+                # to_csv의 셀 단위 파이썬 루프를 대체
+                pa_csv.write_csv(
+                    pa.Table.from_pandas(export, preserve_index=False), filename)
+            else:
+                export.to_csv(filename, index=False, encoding='utf-8')
             print(f"결과가 {filename}에 저장되었습니다.")
         else:
             print("저장할 결과가 없습니다.")
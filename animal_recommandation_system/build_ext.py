@@ -0,0 +1,24 @@
+"""
+점수 커널 AOT 빌드 스크립트
+
+Numba JIT은 새 프로세스마다 첫 호출에서 컴파일 지연이 발생한다.
+`python build_ext.py`로 animal_score 확장 모듈(.so)을 미리 빌드해 두면
+animal_filter가 JIT 대신 이를 임포트해 기동 지연 없이 점수를 계산한다.
+"""
+
+from numba.pycc import CC
+
+from animal_filter import _score_all_impl
+
+cc = CC('animal_score')
+
+# _score_with_kernel이 전달하는 배열 타입과 일치해야 함
+cc.export(
+    'score_all',
+    'f4[:](f4[:], f4[:], f4[:,:], f4[:], u8[:], f4[:], f4[:], f4[:], b1[:], f4[:])'
+)(_score_all_impl)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print("✅ animal_score 확장 모듈 빌드 완료")
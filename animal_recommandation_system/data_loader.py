@@ -0,0 +1,133 @@
+"""
+임시보호 동물 데이터 로더 모듈
+전처리 결과를 Parquet으로 캐시해 재기동 시 CSV 파싱 비용을 건너뜀
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_preprocessor import DataPreprocessor
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def _cache_key(csv_path: str) -> str:
+    """CSV 내용 해시 + mtime으로 캐시 키 생성 (둘 중 하나만 달라져도 미스)"""
+    with open(csv_path, 'rb') as f:
+        digest = hashlib.md5(f.read()).hexdigest()[:8]
+    return f"{digest}_{int(os.path.getmtime(csv_path))}"
+
+
+def _cache_paths(csv_path: str, key: str):
+    """키에 대응하는 (.cache 디렉터리, Parquet 경로, 메타데이터 JSON 경로)"""
+    cache_dir = os.path.join(os.path.dirname(csv_path) or '.', '.cache')
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    base = os.path.join(cache_dir, f"{stem}.{key}")
+    return cache_dir, base + '.parquet', base + '.meta.json'
+
+
+def _json_default(value):
+    """통계 dict의 numpy 스칼라를 JSON 기본 타입으로 변환"""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    raise TypeError(f"직렬화할 수 없는 타입: {type(value)}")
+
+
+def _restore_nested(df: pd.DataFrame) -> pd.DataFrame:
+    """Parquet 역직렬화 과정에서 ndarray로 돌아온 리스트 컬럼을 원형으로 복원"""
+    df['hashtags'] = [list(tags) if tags is not None else [] for tags in df['hashtags']]
+
+    def restore_care_conditions(cc):
+        homes = cc.get('suitable_homes')
+        cc['suitable_homes'] = list(homes) if homes is not None else []
+        duration = cc.get('duration')
+        cc['duration'] = int(duration) if duration is not None and not pd.isna(duration) else None
+        return cc
+
+    def restore_health_info(health):
+        vaccination = health.get('vaccination')
+        if vaccination is not None and len(vaccination) > 0:
+            health['vaccination'] = [dict(v) for v in vaccination]
+        else:
+            health['vaccination'] = None
+        return health
+
+    df['care_conditions'] = [restore_care_conditions(cc) for cc in df['care_conditions']]
+    df['health_info'] = [restore_health_info(h) for h in df['health_info']]
+    # 평탄 컬럼이 없는 구버전 캐시는 KeyError로 탈락시켜 재파싱 유도
+    df['suitable_homes'] = [list(homes) if homes is not None else []
+                            for homes in df['suitable_homes']]
+    return df
+
+
+def load_animals(csv_path: str, preprocessor: DataPreprocessor = None) -> pd.DataFrame:
+    """
+    전처리된 동물 데이터 로드 (.cache/의 Parquet 캐시 우선)
+
+    CSV 내용 해시 + mtime을 키로 한 캐시가 있으면 pd.read_parquet으로
+    바로 읽어 CSV 파싱과 전처리를 건너뛰고, 함께 저장된 메타데이터
+    JSON으로 고유값/통계 재계산까지 생략한다. 미스면 전처리 후 캐시를
+    갱신하고 같은 CSV의 구 키 캐시는 정리한다.
+
+    Args:
+        csv_path: 원본 CSV 파일 경로
+        preprocessor: 재사용할 전처리기 (없으면 새로 생성)
+
+    Returns:
+        전처리된 데이터프레임
+    """
+    if preprocessor is None:
+        preprocessor = DataPreprocessor()
+
+    key = _cache_key(csv_path)
+    cache_dir, cache_path, meta_path = _cache_paths(csv_path, key)
+
+    if PARQUET_AVAILABLE and os.path.exists(cache_path):
+        try:
+            processed = _restore_nested(pd.read_parquet(cache_path))
+            preprocessor.processed_data = processed
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                preprocessor.metadata = saved['metadata']
+                preprocessor._stats_cache = saved['statistics']
+            except (OSError, ValueError, KeyError):
+                # 메타데이터 캐시만 깨진 경우 프레임에서 다시 계산
+                preprocessor._generate_metadata()
+            print(f"캐시에서 {len(processed)}개의 동물 데이터 로드됨")
+            return processed
+        except Exception:
+            # 손상되거나 호환되지 않는 캐시는 무시하고 CSV를 다시 파싱
+            pass
+
+    processed = preprocessor.load_and_process(csv_path)
+
+    if PARQUET_AVAILABLE:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # 같은 CSV의 구 키 캐시 정리 (내용/시각이 바뀔 때마다 누적 방지)
+            stem = os.path.splitext(os.path.basename(csv_path))[0]
+            for stale in glob.glob(os.path.join(cache_dir, f"{stem}.*")):
+                if not os.path.basename(stale).startswith(f"{stem}.{key}."):
+                    os.remove(stale)
+            processed.to_parquet(cache_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'metadata': preprocessor.get_metadata(),
+                           'statistics': preprocessor.get_statistics()},
+                          f, ensure_ascii=False, default=_json_default)
+        except Exception:
+            # 직렬화 실패 시 캐시 없이 진행 (다음 실행에서 재시도)
+            pass
+
+    return processed
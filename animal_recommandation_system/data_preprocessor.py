@@ -3,14 +3,139 @@
 CSV 데이터를 정제하고 필터링을 위한 구조화된 형태로 변환
 """
 
+import os
 import pandas as pd
 import numpy as np
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+# 프로세스 풀 분배가 직렬화 비용을 상쇄하는 최소 행 수
+_PARALLEL_MIN_ROWS = 50000
+
+# 이 크기 이상의 CSV는 전체 적재 대신 청크 스트리밍으로 읽음
+_STREAMING_MIN_BYTES = 256 * 1024 * 1024
+_CSV_CHUNK_ROWS = 200000
+
+# 추출 패턴은 모듈 로드 시 1회만 컴파일 (호출마다 re 캐시 조회·파싱 제거)
+_ID_RE = re.compile(r'/(\d+)/$')
+_YEAR_RE = re.compile(r'(\d{4})')
+_WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_DUR_RE = re.compile(r'(\d+)')
+_VAC_RE = re.compile(r'(\d+)차접종.*?(\d{2}\.\d{2}\.\d{2})')
+
+# 행마다 datetime.now()를 호출하지 않도록 기준 연도를 로드 시 1회 고정
+_CURRENT_YEAR = datetime.now().year
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 행동 특성(1-5 스케일) 컬럼은 파싱 단계에서 바로 정수로 받도록 지정
+_DTYPE_MAP = {
+    f'참고용정보_{name}': 'Int8'
+    for name in ('배변', '산책', '짖음', '분리불안', '털빠짐',
+                 '스킨십', '대인', '대견', '외동', '대묘')
+}
+
+# '차접종' UTF-8 바이트 시퀀스 — 접종 기록 스캔의 기준점
+_VAC_MARKER = np.frombuffer('차접종'.encode('utf-8'), dtype=np.uint8)
+
+
+def _scan_vaccinations_impl(buf, marker):
+    """
+    접종 현황 문자열(UTF-8 바이트)에서 (회차, yymmdd) 쌍을 추출하는 스캐너
+
+    줄마다 '숫자+차접종' 뒤에 처음 나오는 dd.dd.dd 날짜를 찾는다.
+    _VAC_RE와 동일한 의미를 바이트 단위 비교로 수행해 정규식 엔진을 거치지
+    않으며, Numba가 있으면 기계어로 컴파일된다.
+    """
+    n = buf.shape[0]
+    m = marker.shape[0]
+    max_rows = 1
+    for i in range(n):
+        if buf[i] == 10:  # '\n'
+            max_rows += 1
+    rounds = np.empty(max_rows, dtype=np.int32)
+    dates = np.empty(max_rows, dtype=np.int32)
+    count = 0
+
+    line_start = 0
+    i = 0
+    while i <= n:
+        if i == n or buf[i] == 10:
+            j = line_start
+            while j + m <= i:
+                k = 0
+                while k < m and buf[j + k] == marker[k]:
+                    k += 1
+                if k == m:
+                    # 마커 직전의 연속 숫자 = 회차
+                    d_start = j
+                    while d_start > line_start and 48 <= buf[d_start - 1] <= 57:
+                        d_start -= 1
+                    if d_start < j:
+                        rnd = 0
+                        for p in range(d_start, j):
+                            rnd = rnd * 10 + (buf[p] - 48)
+                        # 마커 이후 같은 줄에서 dd.dd.dd 탐색
+                        q = j + m
+                        while q + 8 <= i:
+                            if (48 <= buf[q] <= 57 and 48 <= buf[q + 1] <= 57 and
+                                    buf[q + 2] == 46 and
+                                    48 <= buf[q + 3] <= 57 and 48 <= buf[q + 4] <= 57 and
+                                    buf[q + 5] == 46 and
+                                    48 <= buf[q + 6] <= 57 and 48 <= buf[q + 7] <= 57):
+                                rounds[count] = rnd
+                                dates[count] = (
+                                    (buf[q] - 48) * 100000 + (buf[q + 1] - 48) * 10000 +
+                                    (buf[q + 3] - 48) * 1000 + (buf[q + 4] - 48) * 100 +
+                                    (buf[q + 6] - 48) * 10 + (buf[q + 7] - 48))
+                                count += 1
+                                j = i  # 줄당 첫 매치만 (re.search와 동일)
+                                break
+                            q += 1
+                j += 1
+            line_start = i + 1
+        i += 1
+
+    return rounds, dates, count
+
+
+def _safe_int_batch_impl(arr):
+    """
+    float64 배열을 정수 배열 + 유효성 마스크로 일괄 변환
+
+    행마다 try/except로 예외를 삼키는 대신 NaN 검사 분기만 수행한다.
+    Numba가 있으면 기계어로 컴파일된다.
+    """
+    out = np.empty(arr.size, dtype=np.int64)
+    valid = np.empty(arr.size, dtype=np.bool_)
+    for i in range(arr.size):
+        value = arr[i]
+        ok = not np.isnan(value)
+        valid[i] = ok
+        out[i] = np.int64(value) if ok else 0
+    return out, valid
+
+
+if NUMBA_AVAILABLE:
+    _scan_vaccinations = numba.njit(cache=True)(_scan_vaccinations_impl)
+    _safe_int_batch = numba.njit(cache=True)(_safe_int_batch_impl)
+else:
+    def _scan_vaccinations(buf, marker):
+        # NumPy 2의 스칼라 승격 규칙에서는 uint8 원소 산술이 자릿수 계산에서
+        # OverflowError를 내므로, 비컴파일 경로는 int64 사본을 스캔한다
+        return _scan_vaccinations_impl(
+            buf.astype(np.int64), marker.astype(np.int64))
+    _safe_int_batch = _safe_int_batch_impl
+
 
 class DataPreprocessor:
     """임시보호 동물 데이터 전처리 클래스"""
@@ -19,6 +144,8 @@ class DataPreprocessor:
         self.raw_data = None
         self.processed_data = None
         self.metadata = {}
+        self._stats_cache = None
+        self._current_year = _CURRENT_YEAR
     
     def load_and_process(self, csv_path: str) -> pd.DataFrame:
         """
@@ -30,12 +157,38 @@ class DataPreprocessor:
         Returns:
             전처리된 데이터프레임
         """
-        # CSV 파일 로드
-        self.raw_data = pd.read_csv(csv_path, encoding='utf-8')
-        print(f"총 {len(self.raw_data)}개의 동물 데이터 로드됨")
-        
-        # 데이터 전처리 수행
-        self.processed_data = self._process_all_data()
+        # 장기 실행 프로세스에서 연도가 바뀌어도 로드 시점 기준으로 계산
+        self._current_year = datetime.now().year
+
+        # 이전 로드의 캐시 무효화
+        self.metadata = {}
+        self._stats_cache = None
+
+        if os.path.getsize(csv_path) >= _STREAMING_MIN_BYTES:
+            # 대용량 파일: 전체 적재 대신 청크 단위로 읽으며 즉시 전처리
+            # (상주 메모리를 청크 크기로 제한, pyarrow 엔진은 chunksize 미지원)
+            processed_chunks = []
+            total_rows = 0
+            for chunk in pd.read_csv(csv_path, encoding='utf-8',
+                                     chunksize=_CSV_CHUNK_ROWS):
+                self.raw_data = chunk
+                processed_chunks.append(self._process_all_data_vectorized())
+                total_rows += len(chunk)
+            print(f"총 {total_rows}개의 동물 데이터 로드됨")
+
+            self.processed_data = self._finalize_dtypes(
+                pd.concat(processed_chunks, copy=False, ignore_index=True))
+        else:
+            # CSV 파일 로드 — 멀티스레드 pyarrow 파서 우선, 실패 시 기본 파서
+            try:
+                self.raw_data = pd.read_csv(
+                    csv_path, encoding='utf-8', engine='pyarrow', dtype=_DTYPE_MAP)
+            except (ImportError, ValueError):
+                self.raw_data = pd.read_csv(csv_path, encoding='utf-8')
+            print(f"총 {len(self.raw_data)}개의 동물 데이터 로드됨")
+
+            # 데이터 전처리 수행
+            self.processed_data = self._process_all_data()
         
         # 메타데이터 생성
         self._generate_metadata()
@@ -43,79 +196,304 @@ class DataPreprocessor:
         print(f"전처리 완료: {len(self.processed_data)}개의 데이터 처리됨")
         return self.processed_data
     
+    # 고유값이 적어 category 인코딩이 유리한 컬럼
+    _CATEGORICAL_COLUMNS = ('status', 'care_type', 'rescue_location',
+                            'gender', 'care_pickup')
+
+    # 행동 특성(1-5 스케일) 평탄 컬럼 — 결측 허용 int8이면 충분
+    _BEHAVIOR_COLS = ('toilet_training', 'walking_needs', 'barking',
+                      'separation_anxiety', 'shedding', 'affection',
+                      'human_friendly', 'dog_friendly', 'solo_living',
+                      'cat_friendly')
+
     def _process_all_data(self) -> pd.DataFrame:
-        """모든 데이터에 대해 전처리 수행"""
-        processed_list = []
-        
-        for idx, row in self.raw_data.iterrows():
-            processed_animal = self._process_animal_data(row)
-            processed_list.append(processed_animal)
-        
-        return pd.DataFrame(processed_list)
-    
-    def _process_animal_data(self, animal: pd.Series) -> Dict:
-        """개별 동물 데이터 전처리"""
+        """모든 데이터에 대해 전처리 수행 (열 단위 벡터 연산, 대량이면 병렬)"""
+        n_workers = os.cpu_count() or 1
+        try:
+            if len(self.raw_data) >= _PARALLEL_MIN_ROWS and n_workers > 1:
+                # 행 간 의존이 없어 청크 분할이 자유로움 — 코어 수만큼 분배
+                chunks = np.array_split(self.raw_data, n_workers)
+                args = [(chunk, self._current_year) for chunk in chunks if len(chunk)]
+                with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                    parts = list(executor.map(_process_frame_chunk, args))
+                df = pd.concat(parts, copy=False, ignore_index=True)
+            else:
+                df = self._process_all_data_vectorized()
+        except (KeyError, TypeError, ValueError):
+            # 열 단위 경로가 전제하는 스키마와 어긋나는 입력은 행 단위로 재처리
+            df = self._process_all_data_rowwise()
+
+        return self._finalize_dtypes(df)
+
+    def _finalize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """전처리 프레임의 최종 타입 정리 (청크 병합 후 일괄 적용)"""
+        # 저카디널리티 문자열을 정수 코드 + 사전 구조로 보관
+        # value_counts/unique가 문자열 해시 대신 정수 히스토그램으로 동작
+        for column in self._CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+
+        # 특성 값(1-5)을 PyObject 박싱 없는 1바이트 정수 열로 보관
+        behavior_cols = [c for c in self._BEHAVIOR_COLS if c in df.columns]
+        df[behavior_cols] = df[behavior_cols].astype('Int8')
+
+        # 수치 열 다운캐스트 — 이후 모든 집계가 읽는 바이트 수를 절감
+        if 'weight' in df.columns:
+            df['weight'] = df['weight'].astype('float32')
+        for column in ('birth_year', 'age'):
+            if column in df.columns:
+                df[column] = df[column].astype('Int16')
+
+        return df
+
+    def _process_all_data_rowwise(self) -> pd.DataFrame:
+        """행 단위 폴백 경로 — 벡터화 경로와 동일한 결과를 생성"""
+        # iterrows()는 행마다 Series를 새로 만들므로 위치 기반 튜플 순회로 대체
+        # 결과 리스트는 행 수만큼 선할당해 append 재할당을 피함
+        col_idx = {name: i for i, name in enumerate(self.raw_data.columns)}
+        processed_list = [None] * len(self.raw_data)
+        for i, row in enumerate(self.raw_data.itertuples(index=False, name=None)):
+            processed_list[i] = self._process_animal_data(row, col_idx)
+
+        # dict 리스트를 바로 넘기면 pandas가 행→열 전치와 타입 추론을
+        # 파이썬 레벨에서 수행하므로, 열 단위 dict로 재배열해 전달
+        columns = {
+            key: [record[key] for record in processed_list]
+            for key in (processed_list[0] if processed_list else ())
+        }
+        return self._add_flat_columns(pd.DataFrame(columns, copy=False))
+
+    @staticmethod
+    def _add_flat_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """중첩 dict 컬럼에서 SoA 평탄 컬럼을 파생 (행 단위 폴백용)"""
+        if df.empty:
+            return df
+
+        # dict 조회를 파이썬 루프 대신 map(itemgetter)의 C 루프로 수행
+        care = df['care_conditions']
+        df['care_region'] = care.map(itemgetter('region'))
+        df['care_duration'] = pd.to_numeric(
+            care.map(itemgetter('duration')), errors='coerce')
+        df['care_pickup'] = care.map(itemgetter('pickup'))
+        df['care_additional_conditions'] = care.map(itemgetter('additional_conditions'))
+        df['suitable_homes'] = care.map(itemgetter('suitable_homes'))
+
+        health = df['health_info']
+        vaccinations = health.map(itemgetter('vaccination'))
+        df['vaccination_count'] = [len(vac) if vac else 0 for vac in vaccinations]
+        df['medical_history'] = health.map(itemgetter('medical_history'))
+
+        traits = df['behavior_traits']
+        for key in traits.iloc[0]:
+            values = pd.to_numeric(
+                traits.map(itemgetter(key)), errors='coerce').to_numpy(dtype=np.float64)
+            ints, valid = _safe_int_batch(values)
+            df[key] = pd.arrays.IntegerArray(ints.astype(np.int8), ~valid)
+
+        return df
+
+    def _process_all_data_vectorized(self) -> pd.DataFrame:
+        """
+        열 단위 벡터 연산으로 전체 데이터 전처리
+
+        행마다 정규식/분기 함수를 호출하는 대신 컬럼별로 컴파일된 정규식
+        한 번의 C 루프(.str 액세서)로 추출하고, 나이는 열 뺄셈 한 번으로
+        계산한다. 하위 호환을 위해 care_conditions/health_info/behavior_traits는
+        기존과 같은 중첩 dict 형태로 재조립한다.
+        """
+        raw = self.raw_data
+        n = len(raw)
+
+        def col(name) -> pd.Series:
+            """결측 컬럼도 안전하게 다루는 원본 열 접근"""
+            if name in raw.columns:
+                return raw[name]
+            return pd.Series([None] * n, index=raw.index, dtype=object)
+
+        def stripped(name) -> pd.Series:
+            return col(name).astype(object).astype(str).str.strip()
+
+        # 문자열/수치 추출 — 컬럼당 정규식 1회
+        ids = col('상세링크').astype(object).astype(str).str.extract(_ID_RE, expand=False)
+        birth_year = pd.to_numeric(
+            col('출생시기').astype(object).astype(str).str.extract(_YEAR_RE, expand=False), errors='coerce')
+        age = self._current_year - birth_year
+        weight = pd.to_numeric(
+            col('몸무게').astype(object).astype(str).str.extract(_WEIGHT_RE, expand=False), errors='coerce')
+
+        # 성별/중성화 정규화 — 불리언 마스크 조합
+        gender_raw = col('성별')
+        gender_str = gender_raw.astype(object).astype(str).str.strip().str.lower()
+        gender = np.select(
+            [gender_raw.isna().to_numpy(),
+             gender_str.str.contains('남|male', regex=True).to_numpy(),
+             gender_str.str.contains('여|female', regex=True).to_numpy()],
+            [None, 'male', 'female'],
+            default='unknown')
+
+        neutered_raw = col('중성화 여부')
+        neutered_hit = neutered_raw.astype(object).astype(str).str.contains(
+            '완', regex=False).to_numpy()
+        neutered = [None if missing else bool(hit)
+                    for missing, hit in zip(neutered_raw.isna().to_numpy(),
+                                            neutered_hit)]
+
+        # 해시태그/가정 유형 — 분리 후 단일 패스 정리
+        hashtags = [
+            [tag.replace('#', '').strip() for tag in str(s).split(',') if tag.strip()]
+            if not pd.isna(s) else []
+            for s in col('해시태그')
+        ]
+        suitable_homes = [
+            [home.strip() for home in str(s).split(',') if home.strip()]
+            if not pd.isna(s) else []
+            for s in col('이런_집도_가능해요')
+        ]
+
+        duration = pd.to_numeric(
+            col('임보조건_임보 기간').astype(object).astype(str).str.extract(_DUR_RE, expand=False), errors='coerce')
+
+        care_conditions = [
+            {'region': region, 'duration': int(dur) if not pd.isna(dur) else None,
+             'pickup': pickup, 'additional_conditions': additional,
+             'suitable_homes': homes}
+            for region, dur, pickup, additional, homes in zip(
+                stripped('임보조건_지역'), duration,
+                stripped('임보조건_픽업'), col('임보조건_기타 조건'),
+                suitable_homes)
+        ]
+
+        vaccinations = [self._process_vaccination(vac) for vac in col('건강정보_접종 현황')]
+        health_info = [
+            {'vaccination': vac, 'examination': exam,
+             'medical_history': med, 'additional_notes': notes}
+            for vac, exam, med, notes in zip(
+                vaccinations, col('건강정보_검사 현황'),
+                col('건강정보_병력 사항'), col('건강정보_기타 사항'))
+        ]
+
+        trait_columns = {
+            key: pd.to_numeric(col(raw_name), errors='coerce')
+            for key, raw_name in (
+                ('toilet_training', '참고용정보_배변'),
+                ('walking_needs', '참고용정보_산책'),
+                ('barking', '참고용정보_짖음'),
+                ('separation_anxiety', '참고용정보_분리불안'),
+                ('shedding', '참고용정보_털빠짐'),
+                ('affection', '참고용정보_스킨십'),
+                ('human_friendly', '참고용정보_대인'),
+                ('dog_friendly', '참고용정보_대견'),
+                ('solo_living', '참고용정보_외동'),
+                ('cat_friendly', '참고용정보_대묘'),
+            )
+        }
+        behavior_traits = [
+            {key: int(v) if not pd.isna(v) else None
+             for key, v in zip(trait_columns, values)}
+            for values in zip(*trait_columns.values())
+        ]
+
+        frame = {
+            'id': ids,
+            'name': stripped('이름'),
+            'status': stripped('현 상황'),
+            'care_type': stripped('임보종류'),
+            'rescue_location': stripped('구조 지역'),
+            'gender': gender,
+            'neutered': neutered,
+            'birth_year': birth_year,
+            'weight': weight,
+            'age': age,
+            'hashtags': hashtags,
+            'care_conditions': care_conditions,
+            'health_info': health_info,
+            'behavior_traits': behavior_traits,
+            'support_provided': stripped('책임자_제공_사항'),
+            'detail_link': stripped('상세링크'),
+            'sns_link': col('SNS'),
+            'announcement_number': stripped('공고번호'),
+            # SoA 평탄 컬럼 — 집계/저장이 object 셀 순회 없이 열 연산으로 가능
+            'care_region': stripped('임보조건_지역'),
+            'care_duration': duration,
+            'care_pickup': stripped('임보조건_픽업'),
+            'care_additional_conditions': col('임보조건_기타 조건'),
+            'suitable_homes': suitable_homes,
+            'vaccination_count': [len(vac) if vac else 0 for vac in vaccinations],
+            'medical_history': col('건강정보_병력 사항'),
+        }
+        frame.update(trait_columns)
+        return pd.DataFrame(frame, copy=False)
+
+    def _process_animal_data(self, animal: tuple, col_idx: Dict[str, int]) -> Dict:
+        """개별 동물 데이터 전처리 (컬럼명→위치 매핑으로 튜플 값 접근)"""
+        def get(name, default=None):
+            i = col_idx.get(name)
+            return animal[i] if i is not None else default
+
+        # 출생연도는 한 번만 파싱해 나이 계산에 재사용
+        birth_year = self._extract_birth_year(get('출생시기'))
+
         return {
             # 기본 정보
-            'id': self._extract_id(animal.get('상세링크', '')),
-            'name': str(animal.get('이름', '')).strip(),
-            'status': str(animal.get('현 상황', '')).strip(),
-            'care_type': str(animal.get('임보종류', '')).strip(),
-            'rescue_location': str(animal.get('구조 지역', '')).strip(),
+            'id': self._extract_id(get('상세링크', '')),
+            'name': str(get('이름', '')).strip(),
+            'status': str(get('현 상황', '')).strip(),
+            'care_type': str(get('임보종류', '')).strip(),
+            'rescue_location': str(get('구조 지역', '')).strip(),
             
             # 동물 기본 특성
-            'gender': self._normalize_gender(animal.get('성별')),
-            'neutered': self._normalize_neutered(animal.get('중성화 여부')),
-            'birth_year': self._extract_birth_year(animal.get('출생시기')),
-            'weight': self._extract_weight(animal.get('몸무게')),
-            'age': self._calculate_age(animal.get('출생시기')),
+            'gender': self._normalize_gender(get('성별')),
+            'neutered': self._normalize_neutered(get('중성화 여부')),
+            'birth_year': birth_year,
+            'weight': self._extract_weight(get('몸무게')),
+            'age': self._calculate_age(birth_year),
             
             # 해시태그 처리
-            'hashtags': self._process_hashtags(animal.get('해시태그')),
+            'hashtags': self._process_hashtags(get('해시태그')),
             
             # 임보 조건
             'care_conditions': {
-                'region': str(animal.get('임보조건_지역', '')).strip(),
-                'duration': self._process_duration(animal.get('임보조건_임보 기간')),
-                'pickup': str(animal.get('임보조건_픽업', '')).strip(),
-                'additional_conditions': animal.get('임보조건_기타 조건'),
-                'suitable_homes': self._process_suitable_homes(animal.get('이런_집도_가능해요'))
+                'region': str(get('임보조건_지역', '')).strip(),
+                'duration': self._process_duration(get('임보조건_임보 기간')),
+                'pickup': str(get('임보조건_픽업', '')).strip(),
+                'additional_conditions': get('임보조건_기타 조건'),
+                'suitable_homes': self._process_suitable_homes(get('이런_집도_가능해요'))
             },
             
             # 건강 정보
             'health_info': {
-                'vaccination': self._process_vaccination(animal.get('건강정보_접종 현황')),
-                'examination': animal.get('건강정보_검사 현황'),
-                'medical_history': animal.get('건강정보_병력 사항'),
-                'additional_notes': animal.get('건강정보_기타 사항')
+                'vaccination': self._process_vaccination(get('건강정보_접종 현황')),
+                'examination': get('건강정보_검사 현황'),
+                'medical_history': get('건강정보_병력 사항'),
+                'additional_notes': get('건강정보_기타 사항')
             },
             
             # 행동 특성 (1-5 스케일)
             'behavior_traits': {
-                'toilet_training': self._safe_int_convert(animal.get('참고용정보_배변')),
-                'walking_needs': self._safe_int_convert(animal.get('참고용정보_산책')),
-                'barking': self._safe_int_convert(animal.get('참고용정보_짖음')),
-                'separation_anxiety': self._safe_int_convert(animal.get('참고용정보_분리불안')),
-                'shedding': self._safe_int_convert(animal.get('참고용정보_털빠짐')),
-                'affection': self._safe_int_convert(animal.get('참고용정보_스킨십')),
-                'human_friendly': self._safe_int_convert(animal.get('참고용정보_대인')),
-                'dog_friendly': self._safe_int_convert(animal.get('참고용정보_대견')),
-                'solo_living': self._safe_int_convert(animal.get('참고용정보_외동')),
-                'cat_friendly': self._safe_int_convert(animal.get('참고용정보_대묘'))
+                'toilet_training': self._safe_int_convert(get('참고용정보_배변')),
+                'walking_needs': self._safe_int_convert(get('참고용정보_산책')),
+                'barking': self._safe_int_convert(get('참고용정보_짖음')),
+                'separation_anxiety': self._safe_int_convert(get('참고용정보_분리불안')),
+                'shedding': self._safe_int_convert(get('참고용정보_털빠짐')),
+                'affection': self._safe_int_convert(get('참고용정보_스킨십')),
+                'human_friendly': self._safe_int_convert(get('참고용정보_대인')),
+                'dog_friendly': self._safe_int_convert(get('참고용정보_대견')),
+                'solo_living': self._safe_int_convert(get('참고용정보_외동')),
+                'cat_friendly': self._safe_int_convert(get('참고용정보_대묘'))
             },
             
             # 기타 정보
-            'support_provided': str(animal.get('책임자_제공_사항', '')).strip(),
-            'detail_link': str(animal.get('상세링크', '')).strip(),
-            'sns_link': animal.get('SNS'),
-            'announcement_number': str(animal.get('공고번호', '')).strip()
+            'support_provided': str(get('책임자_제공_사항', '')).strip(),
+            'detail_link': str(get('상세링크', '')).strip(),
+            'sns_link': get('SNS'),
+            'announcement_number': str(get('공고번호', '')).strip()
         }
     
     def _extract_id(self, link: str) -> Optional[str]:
         """상세링크에서 ID 추출"""
         if not link or pd.isna(link):
             return None
-        match = re.search(r'/(\d+)/$', str(link))
+        match = _ID_RE.search(str(link))
         return match.group(1) if match else None
     
     def _normalize_gender(self, gender) -> Optional[str]:
@@ -140,22 +518,20 @@ class DataPreprocessor:
         """출생연도 추출"""
         if pd.isna(birth_info):
             return None
-        match = re.search(r'(\d{4})', str(birth_info))
+        match = _YEAR_RE.search(str(birth_info))
         return int(match.group(1)) if match else None
     
-    def _calculate_age(self, birth_info) -> Optional[int]:
-        """나이 계산"""
-        birth_year = self._extract_birth_year(birth_info)
+    def _calculate_age(self, birth_year: Optional[int]) -> Optional[int]:
+        """나이 계산 (이미 추출된 출생연도 재사용)"""
         if birth_year is None:
             return None
-        current_year = datetime.now().year
-        return current_year - birth_year
+        return self._current_year - birth_year
     
     def _extract_weight(self, weight_str) -> Optional[float]:
         """몸무게 추출 (kg 단위로 변환)"""
         if pd.isna(weight_str):
             return None
-        match = re.search(r'(\d+(?:\.\d+)?)', str(weight_str))
+        match = _WEIGHT_RE.search(str(weight_str))
         return float(match.group(1)) if match else None
     
     def _process_hashtags(self, hashtag_str) -> List[str]:
@@ -169,7 +545,7 @@ class DataPreprocessor:
         """임보 기간 처리"""
         if pd.isna(duration_str):
             return None
-        match = re.search(r'(\d+)', str(duration_str))
+        match = _DUR_RE.search(str(duration_str))
         return int(match.group(1)) if match else None
     
     def _process_suitable_homes(self, homes_str) -> List[str]:
@@ -180,22 +556,21 @@ class DataPreprocessor:
         return [home.strip() for home in homes if home.strip()]
     
     def _process_vaccination(self, vaccination_str) -> Optional[List[Dict]]:
-        """예방접종 정보 처리"""
+        """예방접종 정보 처리 (바이트 스캐너 — Numba 가용 시 기계어 실행)"""
         if pd.isna(vaccination_str):
             return None
-        
-        vaccinations = []
-        lines = str(vaccination_str).split('\n')
-        
-        for line in lines:
-            match = re.search(r'(\d+)차접종.*?(\d{2}\.\d{2}\.\d{2})', line)
-            if match:
-                vaccinations.append({
-                    'round': int(match.group(1)),
-                    'date': match.group(2)
-                })
-        
-        return vaccinations if vaccinations else None
+
+        buf = np.frombuffer(str(vaccination_str).encode('utf-8'), dtype=np.uint8)
+        rounds, dates, count = _scan_vaccinations(buf, _VAC_MARKER)
+        if count == 0:
+            return None
+
+        return [
+            {'round': int(rounds[k]),
+             'date': '{:02d}.{:02d}.{:02d}'.format(
+                 dates[k] // 10000, dates[k] // 100 % 100, dates[k] % 100)}
+            for k in range(count)
+        ]
     
     def _safe_int_convert(self, value) -> Optional[int]:
         """안전한 정수 변환"""
@@ -220,6 +595,9 @@ class DataPreprocessor:
             'all_hashtags': self._get_all_hashtags(),
             'suitable_home_types': self._get_all_suitable_home_types()
         }
+
+        # 통계도 이 시점에 한 번 계산해 두면 이후 조회는 O(1)
+        self._stats_cache = self._compute_statistics()
     
     def _get_age_ranges(self) -> List[Dict]:
         """나이 범위 생성"""
@@ -247,109 +625,90 @@ class DataPreprocessor:
         ]
     
     def _get_all_hashtags(self) -> List[str]:
-        """모든 해시태그 수집"""
-        all_tags = []
-        for hashtags in self.processed_data['hashtags']:
-            all_tags.extend(hashtags)
-        return list(set(all_tags))
-    
+        """모든 해시태그 수집 (explode 후 C 레벨 해시 중복 제거)"""
+        return self.processed_data['hashtags'].explode().dropna().unique().tolist()
+
     def _get_all_suitable_home_types(self) -> List[str]:
-        """모든 적합한 가정 유형 수집"""
-        all_types = []
-        for care_conditions in self.processed_data['care_conditions']:
-            all_types.extend(care_conditions['suitable_homes'])
-        return list(set(all_types))
+        """모든 적합한 가정 유형 수집 (평탄 컬럼에서 explode)"""
+        return self.processed_data['suitable_homes'].explode().dropna().unique().tolist()
     
     def get_processed_data(self) -> pd.DataFrame:
         """처리된 데이터 반환"""
         return self.processed_data
     
     def get_metadata(self) -> Dict:
-        """메타데이터 반환"""
+        """메타데이터 반환 (비어 있으면 1회 생성 후 캐시)"""
+        if not self.metadata and self.processed_data is not None:
+            self._generate_metadata()
         return self.metadata
     
     def get_statistics(self) -> Dict:
-        """데이터 통계 반환"""
+        """데이터 통계 반환 (메타데이터 생성 시 계산된 캐시 사용)"""
         if self.processed_data is None:
             return None
-        
-        total_animals = len(self.processed_data)
-        available_animals = len(self.processed_data[self.processed_data['status'] == '임보가능'])
-        
-        # 성별 분포
-        gender_dist = self.processed_data['gender'].value_counts().to_dict()
-        
-        # 임보 종류 분포
-        care_type_dist = self.processed_data['care_type'].value_counts().to_dict()
-        
-        # 지역 분포 (상위 10개)
-        region_dist = self.processed_data['rescue_location'].value_counts().head(10).to_dict()
-        
-        # 평균 나이 및 몸무게
-        avg_age = self.processed_data['age'].mean()
-        avg_weight = self.processed_data['weight'].mean()
-        
+
+        if self._stats_cache is None:
+            self._stats_cache = self._compute_statistics()
+
+        return dict(self._stats_cache)
+
+    def _compute_statistics(self) -> Dict:
+        """데이터 통계 1회 계산 — 동일 컬럼 재스캔 없이 결과를 캐시에 보관"""
+        df = self.processed_data
+
+        # 분포 통계 (category 컬럼이라 정수 히스토그램으로 집계)
+        gender_dist = df['gender'].value_counts().to_dict()
+        care_type_dist = df['care_type'].value_counts().to_dict()
+        region_dist = df['rescue_location'].value_counts().head(10).to_dict()
+
+        avg_age = df['age'].mean()
+        avg_weight = df['weight'].mean()
+
         return {
-            'total': total_animals,
-            'available': available_animals,
+            'total': len(df),
+            'available': int(df['status'].eq('임보가능').sum()),
             'gender_distribution': gender_dist,
             'care_type_distribution': care_type_dist,
             'region_distribution': region_dist,
-            'average_age': round(avg_age, 1) if not pd.isna(avg_age) else None,
-            'average_weight': round(avg_weight, 1) if not pd.isna(avg_weight) else None
+            # float32 평균은 파이썬 float로 승격 후 반올림 (표시 잡음 방지)
+            'average_age': round(float(avg_age), 1) if not pd.isna(avg_age) else None,
+            'average_weight': round(float(avg_weight), 1) if not pd.isna(avg_weight) else None
         }
     
+    # 저장 시 내보내는 평탄 컬럼 (기존 행 단위 평탄화와 동일한 순서)
+    _EXPORT_COLS = [
+        'id', 'name', 'status', 'care_type', 'rescue_location',
+        'gender', 'neutered', 'birth_year', 'weight', 'age', 'hashtags',
+        'care_region', 'care_duration', 'care_pickup',
+        'care_additional_conditions', 'suitable_homes',
+        'vaccination_count', 'medical_history',
+        'toilet_training', 'walking_needs', 'barking', 'separation_anxiety',
+        'shedding', 'affection', 'human_friendly', 'dog_friendly',
+        'solo_living', 'cat_friendly', 'detail_link',
+    ]
+
     def save_processed_data(self, output_path: str):
-        """전처리된 데이터를 파일로 저장"""
+        """전처리된 데이터를 파일로 저장 (평탄 컬럼 선택 — 행 루프 없음)"""
         if self.processed_data is not None:
-            # DataFrame으로 변환하여 저장하기 위해 복잡한 구조를 평탄화
-            flattened_data = []
-            
-            for _, row in self.processed_data.iterrows():
-                flat_row = {
-                    'id': row['id'],
-                    'name': row['name'],
-                    'status': row['status'],
-                    'care_type': row['care_type'],
-                    'rescue_location': row['rescue_location'],
-                    'gender': row['gender'],
-                    'neutered': row['neutered'],
-                    'birth_year': row['birth_year'],
-                    'weight': row['weight'],
-                    'age': row['age'],
-                    'hashtags': '|'.join(row['hashtags']) if row['hashtags'] else '',
-                    
-                    # 임보 조건
-                    'care_region': row['care_conditions']['region'],
-                    'care_duration': row['care_conditions']['duration'],
-                    'care_pickup': row['care_conditions']['pickup'],
-                    'care_additional_conditions': row['care_conditions']['additional_conditions'],
-                    'suitable_homes': '|'.join(row['care_conditions']['suitable_homes']) if row['care_conditions']['suitable_homes'] else '',
-                    
-                    # 건강 정보
-                    'vaccination_count': len(row['health_info']['vaccination']) if row['health_info']['vaccination'] else 0,
-                    'medical_history': row['health_info']['medical_history'],
-                    
-                    # 행동 특성
-                    'toilet_training': row['behavior_traits']['toilet_training'],
-                    'walking_needs': row['behavior_traits']['walking_needs'],
-                    'barking': row['behavior_traits']['barking'],
-                    'separation_anxiety': row['behavior_traits']['separation_anxiety'],
-                    'shedding': row['behavior_traits']['shedding'],
-                    'affection': row['behavior_traits']['affection'],
-                    'human_friendly': row['behavior_traits']['human_friendly'],
-                    'dog_friendly': row['behavior_traits']['dog_friendly'],
-                    'solo_living': row['behavior_traits']['solo_living'],
-                    'cat_friendly': row['behavior_traits']['cat_friendly'],
-                    
-                    'detail_link': row['detail_link']
-                }
-                flattened_data.append(flat_row)
-            
-            pd.DataFrame(flattened_data).to_csv(output_path, index=False, encoding='utf-8')
+            export = self.processed_data.reindex(columns=self._EXPORT_COLS).copy()
+            export['hashtags'] = export['hashtags'].str.join('|')
+            export['suitable_homes'] = export['suitable_homes'].str.join('|')
+            # float 승격으로 '3'이 '3.0'으로 저장되지 않도록 정수형 유지
+            export['care_duration'] = export['care_duration'].astype('Int64')
+
+            export.to_csv(output_path, index=False, encoding='utf-8')
             print(f"전처리된 데이터가 {output_path}에 저장되었습니다.")
 
 
+def _process_frame_chunk(args) -> pd.DataFrame:
+    """프로세스 풀 워커 — 원본 청크 하나를 벡터화 경로로 전처리"""
+    chunk, current_year = args
+    worker = DataPreprocessor()
+    worker.raw_data = chunk
+    worker._current_year = current_year
+    return worker._process_all_data_vectorized()
+
+
 # 사용 예시
 if __name__ == "__main__":
     # 데이터 전처리기 초기화
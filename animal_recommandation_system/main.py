@@ -3,15 +3,97 @@
 데이터 전처리, 필터링, 추천 기능을 통합 제공
 """
 
+import builtins
 import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import pandas as pd
+
 from data_preprocessor import DataPreprocessor
+from data_loader import load_animals, PARQUET_AVAILABLE
 from animal_filter import AnimalFilter
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json(path: str):
+    """JSON 파일 로드 (orjson이 있으면 C 파서로 3~10배 빠름)"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json_line(obj: Dict) -> str:
+    """NDJSON 한 줄 직렬화 (orjson은 UTF-8 비이스케이프가 기본)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+# 프로필 수가 이보다 적으면 프로세스 풀 기동 비용이 이득을 상쇄
+_BATCH_PARALLEL_MIN_PROFILES = 4
+
+# 워커 프로세스(또는 순차 실행)에서 공유하는 필터
+_BATCH_FILTER = None
+
+
+def _init_batch_worker(csv_path: str):
+    """워커 초기화 — Parquet 캐시에서 데이터를 읽어 필터를 1회 구축"""
+    global _BATCH_FILTER
+    _BATCH_FILTER = AnimalFilter().set_animals(load_animals(csv_path, DataPreprocessor()))
+    _BATCH_FILTER.warm_kernel()
+
+
+def _process_profile(args: tuple) -> Dict:
+    """
+    프로필 하나를 처리해 요약 dict를 반환 (프로필 간 의존 없음)
+
+    하드 필터는 마스크로만 계산하고, 추천 결과의 개별 CSV는 워커가
+    직접 기록한다. 상위 추천 목록은 요약 JSON에 담을 수 있도록
+    기본 타입으로 변환해 돌려준다.
+    """
+    index, profile = args
+    user_id = profile.get('user_id', f'user_{index+1}')
+
+    hard_mask = _BATCH_FILTER.compute_filter_mask(profile.get('hard_filters', {}))
+    summary = {'user_id': user_id, 'hard_filter_count': int(hard_mask.sum())}
+
+    if 'preferences' in profile:
+        recommendations = _BATCH_FILTER.apply_soft_filtering(
+            profile['preferences'], mask=hard_mask)
+        summary['recommendation_count'] = len(recommendations)
+        summary['top_recommendations'] = [
+            {
+                'name': rec['name'],
+                'id': rec['id'],
+                'match_score': float(rec.get('match_score', 0)),
+                'detail_link': rec['detail_link']
+            }
+            for rec in recommendations.head(5).to_dict('records')
+        ]
+
+        # 개별 사용자 결과 — 사용자별 CSV 대신 user_id를 붙인 내보내기
+        # 프레임으로 돌려주고 부모가 Parquet 하나로 합쳐 기록한다
+        if len(recommendations) > 0:
+            if PARQUET_AVAILABLE:
+                export = _BATCH_FILTER._export_frame(recommendations)
+                export.insert(0, 'user_id', user_id)
+                summary['export'] = export
+            else:
+                filename = f"recommendations_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                _BATCH_FILTER.export_results(filename)
+
+    return summary
+
 
 class AnimalRecommendationSystem:
     """임시보호 동물 추천 시스템 메인 클래스"""
@@ -21,24 +103,31 @@ class AnimalRecommendationSystem:
         self.filter = AnimalFilter()
         self.processed_data = None
         self.metadata = None
-        
+        self.csv_path = None
+        # 동물별 표시 문자열 캐시 — 대화형에서 같은 결과를 재조회할 때
+        # 포매팅/조인 작업을 반복하지 않음
+        self._display_cache = {}
+
         if csv_path and os.path.exists(csv_path):
             self.load_data(csv_path)
-    
+
     def load_data(self, csv_path: str):
         """데이터 로드 및 전처리"""
+        self.csv_path = csv_path
+        self._display_cache.clear()
         print("=" * 50)
         print("임시보호 동물 데이터 로딩 중...")
         print("=" * 50)
         
         try:
-            # 데이터 전처리
-            self.processed_data = self.preprocessor.load_and_process(csv_path)
+            # 데이터 전처리 (Parquet 캐시가 있으면 CSV 파싱 생략)
+            self.processed_data = load_animals(csv_path, self.preprocessor)
             self.metadata = self.preprocessor.get_metadata()
             
-            # 필터에 데이터 설정
+            # 필터에 데이터 설정 후 점수 커널을 미리 컴파일
             self.filter.set_animals(self.processed_data)
-            
+            self.filter.warm_kernel()
+
             print("\n✅ 데이터 로딩 완료!")
             self.show_data_summary()
             
@@ -160,7 +249,24 @@ class AnimalRecommendationSystem:
         print("=" * 50)
         
         preferences = self.get_user_preferences()
-        
+
+        # 모든 프롬프트를 그냥 넘기면 가중치 기본값만 남는다 — 점수 패스가
+        # 무의미하므로 O(N) 스코어링 없이 임보 가능 목록을 바로 보여준다
+        if not (set(preferences) - {'weights'}):
+            print("\nℹ️ 입력된 선호가 없어 임보 가능한 동물을 그대로 표시합니다.")
+            # 임보가능 부분집합은 필터가 데이터 설정 시점에 계산해 둔 캐시 재사용
+            available = self.filter.get_available().head(10)
+            # 저장 메뉴가 표시된 목록을 내보내도록 필터 결과를 동기화
+            self.filter.filtered_results = available
+            if len(available) == 0:
+                print("😿 추천할 수 있는 동물이 없습니다.")
+                return None
+            print("-" * 80)
+            for i, animal in enumerate(available.to_dict('records')):
+                print(f"{i+1:2d}. {self._format_display_entry(animal, with_header=True)}")
+                print()
+            return available
+
         print(f"\n🧠 추천 점수 계산 중...")
         recommendations = self.filter.apply_soft_filtering(preferences, threshold=0.3)
         
@@ -251,11 +357,9 @@ class AnimalRecommendationSystem:
         print(f"\n📋 필터링 결과 (상위 10마리)")
         print("-" * 80)
         
-        for i, (idx, animal) in enumerate(results.head(10).iterrows()):
-            print(f"{i+1:2d}. {animal['name']} ({animal['gender']}, {animal['age']}세, {animal['weight']}kg)")
-            print(f"    📍 {animal['rescue_location']} | 🏠 {animal['care_type']}")
-            print(f"    🏷️ {', '.join(animal['hashtags'][:3])}")
-            print(f"    🔗 {animal['detail_link']}")
+        # iterrows의 행별 Series 생성 비용 없이 dict 목록으로 순회
+        for i, animal in enumerate(results.head(10).to_dict('records')):
+            print(f"{i+1:2d}. {self._format_display_entry(animal, with_header=True)}")
             print()
         
         # 통계 표시
@@ -269,14 +373,32 @@ class AnimalRecommendationSystem:
         print(f"\n🎯 추천 결과 (상위 10마리)")
         print("-" * 80)
         
-        for i, (idx, animal) in enumerate(recommendations.head(10).iterrows()):
+        for i, animal in enumerate(recommendations.head(10).to_dict('records')):
             match_score = animal.get('match_score', 0)
             print(f"{i+1:2d}. {animal['name']} (매칭도: {match_score:.1%})")
-            print(f"    👤 {animal['gender']}, {animal['age']}세, {animal['weight']}kg")
-            print(f"    📍 {animal['rescue_location']} | 🏠 {animal['care_type']}")
-            print(f"    🏷️ {', '.join(animal['hashtags'][:3])}")
-            print(f"    🔗 {animal['detail_link']}")
+            print(f"    👤 {self._format_display_entry(animal)}")
             print()
+
+    def _format_display_entry(self, animal: Dict, with_header: bool = False) -> str:
+        """
+        동물 하나의 고정 표시 블록을 포매팅 (id 기준 캐시)
+
+        매칭도처럼 조회마다 달라지는 값은 호출부에서 붙이고, 이름·나이·
+        지역 등 데이터가 바뀌지 않는 한 동일한 부분만 캐시한다.
+        load_data에서 캐시를 비운다.
+        """
+        key = (animal['id'], with_header)
+        entry = self._display_cache.get(key)
+        if entry is None:
+            fields = f"{animal['gender']}, {animal['age']}세, {animal['weight']}kg"
+            if with_header:
+                fields = f"{animal['name']} ({fields})"
+            entry = (f"{fields}\n"
+                     f"    📍 {animal['rescue_location']} | 🏠 {animal['care_type']}\n"
+                     f"    🏷️ {', '.join(animal['hashtags'][:3])}\n"
+                     f"    🔗 {animal['detail_link']}")
+            self._display_cache[key] = entry
+        return entry
     
     def save_results(self, results, filename_prefix="results"):
         """결과 저장"""
@@ -346,6 +468,23 @@ class AnimalRecommendationSystem:
             
             input("\n계속하려면 Enter를 눌러주세요...")
     
+    def run_scripted_mode(self, answers):
+        """
+        미리 준비한 응답 목록으로 대화형 모드를 구동 (벤치마크/회귀 측정용)
+
+        input()이 응답 반복자에서 값을 꺼내도록 잠시 바꿔 대화형과 완전히
+        같은 코드 경로를 스크립트로 돌릴 수 있게 한다. 응답이 소진되면
+        종료(4)를 돌려준다. 통계는 전처리기가 1회 계산 후 캐시하므로
+        요약 화면 재진입 비용은 출력뿐이다.
+        """
+        answers = iter(answers)
+        original_input = builtins.input
+        builtins.input = lambda prompt='': next(answers, '4')
+        try:
+            self.run_interactive_mode()
+        finally:
+            builtins.input = original_input
+
     def get_behavior_statistics(self) -> Dict:
         """행동 특성 통계 계산"""
         behavior_traits = [
@@ -353,86 +492,73 @@ class AnimalRecommendationSystem:
             'shedding', 'affection', 'human_friendly', 'dog_friendly', 'solo_living', 'cat_friendly'
         ]
         
-        stats = {}
-        for trait in behavior_traits:
-            # 각 행동 특성의 평균 점수 계산
-            trait_values = []
-            for _, animal in self.processed_data.iterrows():
-                behavior_data = animal.get('behavior_traits', {})
-                if isinstance(behavior_data, dict) and trait in behavior_data:
-                    value = behavior_data[trait]
-                    if value is not None:
-                        trait_values.append(value)
-            
-            if trait_values:
-                stats[trait] = sum(trait_values) / len(trait_values)
-            else:
-                stats[trait] = None
-        
-        return stats
+        # 전처리 단계에서 평탄화된 trait 컬럼을 열 단위로 일괄 평균 (행 순회 없음)
+        means = self.processed_data.reindex(columns=behavior_traits).mean()
+        return {trait: float(means[trait]) if pd.notna(means[trait]) else None
+                for trait in behavior_traits}
     
     def batch_processing_mode(self, user_profiles_file: str):
         """배치 처리 모드 - 여러 사용자 프로필을 한번에 처리"""
         print(f"\n📁 배치 처리 모드 시작")
         print(f"프로필 파일: {user_profiles_file}")
         
+        global _BATCH_FILTER
+
         try:
-            with open(user_profiles_file, 'r', encoding='utf-8') as f:
-                user_profiles = json.load(f)
-            
-            results_summary = []
-            
-            for i, profile in enumerate(user_profiles):
-                user_id = profile.get('user_id', f'user_{i+1}')
-                print(f"\n처리 중: {user_id}")
-                
-                # 하드 필터링
-                if 'hard_filters' in profile:
-                    hard_results = self.filter.apply_filters(profile['hard_filters'])
-                    print(f"  하드 필터링: {len(hard_results)}마리")
+            user_profiles = _load_json(user_profiles_file)
+
+            # 요약은 전량 버퍼링 대신 사용자별 완료 즉시 NDJSON 한 줄씩 기록
+            # — 프로필 수와 무관하게 상주 메모리가 일정하다
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            summary_filename = f"batch_summary_{timestamp}.ndjson"
+            with open(summary_filename, 'w', encoding='utf-8') as summary_file:
+                # 프로필 간 의존이 없어 프로세스 풀에 그대로 분배할 수 있다.
+                # 워커는 Parquet 캐시에서 데이터를 읽으므로 초기화가 싸다.
+                if len(user_profiles) >= _BATCH_PARALLEL_MIN_PROFILES and \
+                        os.cpu_count() > 1 and self.csv_path:
+                    workers = min(os.cpu_count(), len(user_profiles))
+                    with ProcessPoolExecutor(
+                            max_workers=workers,
+                            initializer=_init_batch_worker,
+                            initargs=(self.csv_path,)) as pool:
+                        results = pool.map(_process_profile, enumerate(user_profiles))
+                        exports = self._stream_batch_results(
+                            user_profiles, results, summary_file)
                 else:
-                    hard_results = self.processed_data[self.processed_data['status'] == '임보가능']
-                
-                # 소프트 필터링 (추천)
-                if 'preferences' in profile:
-                    self.filter.set_animals(hard_results)
-                    recommendations = self.filter.apply_soft_filtering(profile['preferences'])
-                    print(f"  추천 결과: {len(recommendations)}마리")
-                    
-                    # 상위 5개 추천 저장
-                    top_recommendations = recommendations.head(5)
-                    
-                    results_summary.append({
-                        'user_id': user_id,
-                        'hard_filter_count': len(hard_results),
-                        'recommendation_count': len(recommendations),
-                        'top_recommendations': [
-                            {
-                                'name': rec['name'],
-                                'id': rec['id'],
-                                'match_score': rec.get('match_score', 0),
-                                'detail_link': rec['detail_link']
-                            }
-                            for _, rec in top_recommendations.iterrows()
-                        ]
-                    })
-                    
-                    # 개별 사용자 결과 저장
-                    if len(recommendations) > 0:
-                        filename = f"recommendations_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                        self.filter.export_results(filename)
-            
-            # 전체 요약 저장
-            summary_filename = f"batch_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(summary_filename, 'w', encoding='utf-8') as f:
-                json.dump(results_summary, f, ensure_ascii=False, indent=2)
-            
+                    _BATCH_FILTER = self.filter
+                    results = map(_process_profile, enumerate(user_profiles))
+                    exports = self._stream_batch_results(
+                        user_profiles, results, summary_file)
+
             print(f"\n✅ 배치 처리 완료!")
             print(f"요약 파일: {summary_filename}")
+
+            # 사용자별 CSV 수백 개 대신 user_id 열을 가진 Parquet 하나로 기록
+            # — 파일 생성/닫기 시스템 콜이 상수 개로 줄고 압축도 이득
+            if exports:
+                export_filename = f"batch_recommendations_{timestamp}.parquet"
+                pd.concat(exports, ignore_index=True).to_parquet(export_filename)
+                print(f"추천 상세: {export_filename}")
             
         except Exception as e:
             print(f"❌ 배치 처리 실패: {e}")
 
+    @staticmethod
+    def _stream_batch_results(user_profiles: List, results, summary_file) -> List:
+        """완료되는 사용자부터 진행 상황 출력·요약 기록, 내보내기 프레임 수집"""
+        exports = []
+        for profile, result in zip(user_profiles, results):
+            export = result.pop('export', None)
+            if export is not None:
+                exports.append(export)
+            print(f"\n처리 중: {result['user_id']}")
+            if 'hard_filters' in profile:
+                print(f"  하드 필터링: {result['hard_filter_count']}마리")
+            if 'preferences' in profile:
+                print(f"  추천 결과: {result['recommendation_count']}마리")
+                summary_file.write(_dump_json_line(result) + '\n')
+        return exports
+
 
 def create_sample_user_profiles():
     """샘플 사용자 프로필 생성"""
@@ -492,8 +618,12 @@ def create_sample_user_profiles():
         }
     ]
     
-    with open('sample_user_profiles.json', 'w', encoding='utf-8') as f:
-        json.dump(sample_profiles, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        with open('sample_user_profiles.json', 'wb') as f:
+            f.write(orjson.dumps(sample_profiles, option=orjson.OPT_INDENT_2))
+    else:
+        with open('sample_user_profiles.json', 'w', encoding='utf-8') as f:
+            json.dump(sample_profiles, f, ensure_ascii=False, indent=2)
     
     print("✅ 샘플 사용자 프로필이 'sample_user_profiles.json'에 생성되었습니다.")
 